@@ -1,15 +1,21 @@
 import enum
 from abc import abstractmethod
 import random
-from math import dist
-from typing import List, Optional, Callable, Union
+from typing import Iterable, List, Optional, Callable, Union
 from game_components.character.user_character import Character
 from game_components.screen import scaled_w, SCREEN_H
 from game_components.constants import PosType
 from game_components.global_data import GlobalData
+from game_components.timers import Timer
+from game_components.AI.perception import PERCEPTION, ENEMIES, is_alive
 from logger import LOGGER
 
 
+def is_gone(target: Character, generation: int) -> bool:
+    # pooled zombies are respawned as new ones, so tasks holding an old one see a changed generation
+    return target.dead or target.generation != generation
+
+
 class TaskState(enum.Enum):
     Done = 'done'
     InProgress = 'in_progress'
@@ -17,23 +23,46 @@ class TaskState(enum.Enum):
 
 
 class BaseTask:
+    __slots__ = ('timeout', 'timed_out', 'timeout_timer')
     global_data: GlobalData = GlobalData()
     name: str
     verbal_name: str
     STATUS: TaskState = TaskState
     is_blocking: bool = False
     endless: bool = False
+    background: bool = False  # ticked at a lower rate by the AI scheduler
     skippable: bool = True
 
     def __init__(self, timeout: Optional[float] = None):
-        self.timeout: Optional[float] = timeout
+        self.timeout: Optional[float] = None
+        self.timed_out: bool = True
+        self.timeout_timer: Optional[Timer] = None
+        if timeout is not None:
+            self.set_deadline(timeout)
 
     @property
-    def is_time_out(self) -> float:
-        return True if self.timeout is None else self.global_data.time > self.timeout
+    def is_time_out(self) -> bool:
+        return self.timed_out
 
     def set_timeout(self, time: float) -> None:
-        self.timeout = self.global_data.time + time
+        self.set_deadline(self.global_data.time + time)
+
+    def set_deadline(self, deadline: float) -> None:
+        # timed_out flag is raised by the timer service instead of comparing time on every tick
+        if self.timeout_timer:
+            self.timeout_timer.cancel()
+        self.timeout = deadline
+        self.timed_out = self.global_data.time > deadline
+        self.timeout_timer = None if self.timed_out else self.global_data.timers.add_at(deadline, self.on_time_out)
+
+    def on_time_out(self) -> None:
+        self.timed_out = True
+
+    def cancel(self) -> None:
+        # called when the task is dropped from a queue, so the timer heap does not keep it alive until deadline
+        if self.timeout_timer:
+            self.timeout_timer.cancel()
+            self.timeout_timer = None
 
     @abstractmethod
     def tick(self, character: Character, dt: float, time: float, game_obj, ai: 'BaseAI', **kwargs) -> TaskState:
@@ -48,15 +77,19 @@ class BaseAI:
     def __init__(self, character: Character):
         self.character: Character = character
         self.tasks_queue: List[BaseTask] = []
+        # dt accumulated between ticks of the AI scheduler
+        self.accumulated_dt: float = 0
 
     def run_idle_walking(self):
         self.add_task(IdleWalk())
 
     def add_task(self, task: BaseTask) -> None:
         self.tasks_queue.append(task)
+        self.character.wake_up()
 
     def insert_task(self, task: BaseTask, index: int = 0):
         self.tasks_queue.insert(index, task)
+        self.character.wake_up()
 
     @abstractmethod
     def update(self, dt: float, time: float, game_obj) -> None:
@@ -72,11 +105,21 @@ class BaseAI:
 
     def finish_current_task(self):
         if self.tasks_queue:
-            self.tasks_queue.pop(0)
+            self.tasks_queue.pop(0).cancel()
 
     def clear(self):
+        for task in self.tasks_queue:
+            task.cancel()
         return self.tasks_queue.clear()
 
+    @property
+    def is_idle(self) -> bool:
+        return not self.tasks_queue
+
+    @property
+    def is_background(self) -> bool:
+        return bool(self.tasks_queue) and self.tasks_queue[0].background
+
     @property
     def current_task(self) -> Optional[BaseTask]:
         if self.tasks_queue:
@@ -91,6 +134,7 @@ class AI(BaseAI):
 
 
 class GoTo(BaseTask):
+    __slots__ = ('position', 'look_direction')
     name = 'go_to'
 
     def __init__(self, position: PosType, look_direction: Optional[int] = None):
@@ -120,7 +164,9 @@ class GoTo(BaseTask):
 
 
 class IdleWalk(BaseTask):
+    __slots__ = ('subtask', 'stop_on_timeout')
     endless = True
+    background = True
     name = 'idle_walk'
 
     def __init__(self, stop_on_timeout: bool = False):
@@ -139,6 +185,7 @@ class IdleWalk(BaseTask):
                          f'({"timeout" if self.timeout < time else "done"})')
 
             self.set_timeout(self.get_random_time())
+            self.subtask.cancel()
             if random.random():
                 self.subtask: GoTo = GoTo.get_random_go_to_task()
             else:
@@ -149,9 +196,15 @@ class IdleWalk(BaseTask):
 
         return TaskState.InProgress
 
+    def cancel(self) -> None:
+        super().cancel()
+        self.subtask.cancel()
+
 
 class DoNothing(BaseTask):
+    __slots__ = ()
     name = 'do_nothing'
+    background = True
 
     def __init__(self, time: float = None):
         time = time if time else self.get_random_time()
@@ -165,20 +218,22 @@ class DoNothing(BaseTask):
 
 
 class GoToPerson(GoTo):
+    __slots__ = ('wait_for_flying_person', 'target', 'target_generation')
     name = 'got_to_person'
 
     def __init__(self, target: Character, wait_for_flying_person: bool = True):
         self.wait_for_flying_person: bool = wait_for_flying_person
         self.target: Character = target
+        self.target_generation: int = target.generation
         super().__init__(tuple(target.position))
 
     def tick(self, character: Character, dt: float, time: float, ai: BaseAI, **kwargs) -> TaskState:
         self.position = self.target.center
-        if self.target.dead:
+        if is_gone(self.target, self.target_generation):
             character.stop()
             return TaskState.Failed
 
-        elif character.rect.colliderect(self.target.rect):
+        elif PERCEPTION.can_reach(character, self.target):
             character.stop()
             LOGGER.debug(f'{character.name} finished task {self.name} with target {self.target.name}')
             return TaskState.Done
@@ -197,17 +252,29 @@ class GoToPerson(GoTo):
 
 
 class FindTarget(BaseTask):
+    __slots__ = ('filter_func', 'factions', 'found_target')
     name = 'find_target'
 
-    def __init__(self, filter_func: Callable):
+    def __init__(self, filter_func: Optional[Callable] = None, factions: Optional[Iterable[str]] = None):
+        # without filter and factions the nearest alive enemy is taken from the perception blackboard
         super().__init__()
-        self.filter_func: Callable = filter_func
+        self.filter_func: Optional[Callable] = filter_func
+        self.factions: Optional[Iterable[str]] = factions
         self.found_target: Character = None
 
     def tick(self, character: Character, dt: float, time: float, game_obj, **kwargs) -> TaskState:
-        targets: List[Character] = list(filter(self.filter_func, game_obj.characters.values()))
-        if targets:
-            self.found_target = min(targets, key=lambda t: dist(character.position, t.position))
+        percept = PERCEPTION.get(character)
+        if self.filter_func is None and self.factions is None and percept is not None \
+                and (percept.nearest_enemy is None or percept.nearest_enemy.alive):
+            target = percept.nearest_enemy
+        elif self.factions is None:
+            target = game_obj.factions.find_nearest(character.position, predicate=self.filter_func or is_alive,
+                                                    factions=ENEMIES[character.faction])
+        else:
+            target = game_obj.factions.find_nearest(character.position, predicate=self.filter_func,
+                                                    factions=self.factions)
+        if target:
+            self.found_target = target
             return TaskState.Done
 
         else:
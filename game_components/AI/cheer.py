@@ -1,32 +1,49 @@
 import random
+from typing import Optional
 from game_components.AI.base import BaseTask, TaskState
 from game_components.character.user_character import Character
 from game_components.constants import JUMP_VELOCITY
 from game_components.events.base import BaseEvent
+from game_components.timers import Timer
 
 
 class Cheer(BaseTask):
+    __slots__ = ('event_to_follow', 'direction_to_look', 'ready_to_jump', 'jump_timer')
     name = 'cheer'
     endless = True
+    background = True
 
     def __init__(self, event_to_follow: BaseEvent, direction_to_look: int = 1):
         super().__init__()
         self.event_to_follow: BaseEvent = event_to_follow
         self.direction_to_look: int = direction_to_look
-        self.jump_cd: int = 0
+        self.ready_to_jump: bool = True
+        self.jump_timer: Optional[Timer] = None
 
     def tick(self, character: Character, dt: float, time: float, **kwargs) -> TaskState:
         character.set_look_direction(self.direction_to_look)
 
-        if not character.is_falling and self.jump_cd < time:
-            character.push(vertical_velocity=JUMP_VELOCITY * random.uniform(0.1, 1),
-                           horizontal_velocity=random.randint(-5, 5),
-                           rotation_speed=random.randint(-5, 5))
-
-        elif character.is_falling and self.jump_cd < time:
-            self.jump_cd = time + random.randint(0, 5)
+        if self.ready_to_jump:
+            if not character.is_falling:
+                character.push(vertical_velocity=JUMP_VELOCITY * random.uniform(0.1, 1),
+                               horizontal_velocity=random.randint(-5, 5),
+                               rotation_speed=random.randint(-5, 5))
+            else:
+                # next jump cooldown starts when the character is in the air
+                self.ready_to_jump = False
+                self.jump_timer = self.global_data.timers.add_at(time + random.randint(0, 5), self.set_ready_to_jump)
 
         if self.event_to_follow.is_done:
             return TaskState.Done
         else:
             return TaskState.InProgress
+
+    def set_ready_to_jump(self):
+        self.ready_to_jump = True
+        self.jump_timer = None
+
+    def cancel(self) -> None:
+        super().cancel()
+        if self.jump_timer:
+            self.jump_timer.cancel()
+            self.jump_timer = None
@@ -2,13 +2,14 @@ from typing import Union
 from game_components.AI.base import FindTarget, BaseTask, TaskState, IdleWalk, AI
 from game_components.AI.go_and_kill import GoAndKill
 from game_components.character.user_character import Character
-from game_components.character.zombie import Zombie
 
 
 class DefendFromZombies(BaseTask):
+    __slots__ = ('find_target_task', 'current_task')
+
     def __init__(self):
         super().__init__()
-        self.find_target_task: FindTarget = FindTarget(filter_func=lambda z: isinstance(z, Zombie))
+        self.find_target_task: FindTarget = FindTarget()
         self.current_task: Union[GoAndKill, FindTarget] = self.find_target_task
 
     def tick(self, character: Character, dt: float, time: float, ai: AI, **kwargs) -> TaskState:
@@ -5,6 +5,7 @@ from game_components.sounds import play_kick_sound
 
 
 class GoAndKick(GoToPerson):
+    __slots__ = ()
     name = 'go_and_kick'
 
     def tick(self, character: Character, dt: float, time: float, **kwargs) -> TaskState:
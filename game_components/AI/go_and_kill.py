@@ -1,22 +1,28 @@
 from typing import Union
-from game_components.AI.base import GoToPerson, TaskState, BaseTask
+from game_components.AI.base import GoToPerson, TaskState, BaseTask, is_gone
+from game_components.AI.perception import PERCEPTION
 from game_components.character.user_character import Character
 from game_components.weapon.fist import Fists
 
 
 class HitWithFist(BaseTask):
+    __slots__ = ('target', 'target_generation')
     name = 'hit_with_fist'
 
     def __init__(self, target: Character):
         super().__init__()
         self.target: Character = target
+        self.target_generation: int = target.generation
 
     def tick(self, character: Character, dt: float, time: float, **kwargs) -> TaskState:
         if not isinstance(character.weapon, Fists):
             return self.STATUS.Failed  # unknown weapon
 
+        if is_gone(self.target, self.target_generation):
+            return self.STATUS.Failed  # killed before the hit
+
         if character.weapon.ready_to_use:
-            if character.rect.colliderect(self.target.rect):
+            if PERCEPTION.can_reach(character, self.target):
                 character.weapon.use(character=character, target=self.target)
                 return self.STATUS.Done  # made kick
             else:
@@ -26,17 +32,19 @@ class HitWithFist(BaseTask):
 
 
 class GoAndKill(BaseTask):
+    __slots__ = ('target', 'target_generation', 'go_to_task', 'hit_task', 'current_task')
     name = 'go_and_kill'
 
     def __init__(self, target: Character):
         super().__init__()
         self.target: Character = target
+        self.target_generation: int = target.generation
         self.go_to_task: GoToPerson = GoToPerson(target=target, wait_for_flying_person=True)
         self.hit_task: HitWithFist = HitWithFist(target=target)
         self.current_task: Union[GoToPerson, HitWithFist] = self.go_to_task
 
     def tick(self, character: Character, dt: float, time: float, **kwargs) -> TaskState:
-        if self.target.dead:
+        if is_gone(self.target, self.target_generation):
             return self.STATUS.Failed
 
         res = self.current_task.tick(character=character, dt=dt, time=time, **kwargs)
@@ -49,6 +57,6 @@ class GoAndKill(BaseTask):
                 self.current_task = self.go_to_task
 
             elif res == self.STATUS.Done:
-                return self.STATUS.Done if self.target.dead else self.STATUS.InProgress
+                return self.STATUS.Done if is_gone(self.target, self.target_generation) else self.STATUS.InProgress
 
         return TaskState.InProgress
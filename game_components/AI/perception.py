@@ -0,0 +1,135 @@
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+from game_components.constants import FactionsConst
+from game_components.global_data import GD
+from game_components.singletone_decorator import single_tone_decorator
+from game_components.AI.planner import AIPlanner
+from logger import LOGGER
+
+if TYPE_CHECKING:
+    from game_components.character.abc import CharacterABC
+
+__all__ = ['Percept', 'Perception', 'PERCEPTION']
+
+ENEMIES: Dict[str, Tuple[str, ...]] = {
+    FactionsConst.Players: (FactionsConst.Zombies,),
+    FactionsConst.Npcs: (FactionsConst.Zombies,),
+    FactionsConst.Zombies: (FactionsConst.Players, FactionsConst.Npcs),
+}
+ALLIES: Dict[str, Tuple[str, ...]] = {
+    FactionsConst.Players: (FactionsConst.Players, FactionsConst.Npcs),
+    FactionsConst.Npcs: (FactionsConst.Players, FactionsConst.Npcs),
+    FactionsConst.Zombies: (FactionsConst.Zombies,),
+}
+UNKNOWN = object()
+
+
+def is_alive(character: 'CharacterABC') -> bool:
+    return character.alive
+
+
+class Percept:
+    __slots__ = ('step', 'agent', 'factions', 'nearest_enemy', '_nearest_ally', 'in_reach')
+
+    def __init__(self, agent: 'CharacterABC'):
+        self.step: int = -1
+        self.agent: 'CharacterABC' = agent
+        self.factions = None
+        self.nearest_enemy: Optional['CharacterABC'] = None
+        self._nearest_ally = UNKNOWN
+        self.in_reach: Tuple['CharacterABC', ...] = ()
+
+    @property
+    def nearest_ally(self) -> Optional['CharacterABC']:
+        # no task needs allies every step, so they are searched only when asked for
+        if self._nearest_ally is UNKNOWN:
+            self._nearest_ally = self.factions.find_nearest(self.agent.position, predicate=is_alive,
+                                                            factions=ALLIES[self.agent.faction], exclude=self.agent)
+        return self._nearest_ally
+
+
+@single_tone_decorator
+class Perception:
+    # blackboard with surroundings of every alert agent, filled once per simulation step before AI updates,
+    # tasks read it instead of querying the world on their own. Agents with background tasks (walking,
+    # cheering) never look around, so they are not perceived
+    def __init__(self, workers: int = None):
+        self.step: int = 0
+        self.percepts: Dict['CharacterABC', Percept] = {}
+        workers = GD.ai_workers if workers is None else workers
+        # with workers nearest enemies are planned in other processes and used one step later
+        self.planner: Optional[AIPlanner] = AIPlanner(workers, enemies=ENEMIES) if workers else None
+
+    def update(self, agents: Iterable[Tuple[str, 'CharacterABC']], characters_ai: dict, factions):
+        self.step += 1
+        planned = self.collect_planned()
+        alert_agents = [] if self.planner else None
+        for uid, agent in agents:
+            ai = characters_ai.get(uid)
+            if agent.dead or ai is None or ai.is_idle or ai.is_background:
+                continue
+
+            percept = self.percepts.get(agent)
+            if percept is None:
+                percept = self.percepts[agent] = Percept(agent)
+            percept.step = self.step
+            percept.factions = factions
+            percept._nearest_ally = UNKNOWN
+            # a planned miss is searched again, enemies could appear after the snapshot
+            if planned and planned.get(agent) is not None:
+                percept.nearest_enemy = planned[agent]
+            else:
+                percept.nearest_enemy = factions.find_nearest(agent.position, predicate=is_alive,
+                                                              factions=ENEMIES[agent.faction])
+            if alert_agents is not None:
+                alert_agents.append(agent)
+            rect = agent.rect
+            in_reach = [character for character in factions.get_in_x_range(rect.x - factions.max_width, rect.right)
+                        if character is not agent and character.alive and rect.colliderect(character.rect)]
+            percept.in_reach = tuple(in_reach) if in_reach else ()
+
+        if alert_agents:
+            characters = (character for members in factions.members.values() for character in members)
+            self.planner.plan(self.step, characters=characters, agents=alert_agents)
+
+    def collect_planned(self) -> Optional[dict]:
+        # only plans of the previous step are used, older ones are replaced by the main thread search
+        if self.planner is None:
+            return None
+        try:
+            result = self.planner.collect()
+        except Exception as e:
+            LOGGER.error(f'AI planning failed, planning on the main thread from now on: {e}')
+            self.shutdown()
+            return None
+        if result is None:
+            return None
+        step, planned = result
+        return planned if step >= self.step - 1 else None
+
+    def get(self, agent: 'CharacterABC') -> Optional[Percept]:
+        # percept of the current step, agents which were not perceived fall back to their own queries
+        percept = self.percepts.get(agent)
+        if percept is not None and percept.step == self.step:
+            return percept
+        return None
+
+    def can_reach(self, agent: 'CharacterABC', target: 'CharacterABC') -> bool:
+        percept = self.get(agent)
+        if percept is None:
+            return agent.rect.colliderect(target.rect)
+        return target in percept.in_reach
+
+    def forget(self, agent: 'CharacterABC'):
+        self.percepts.pop(agent, None)
+
+    def clear(self):
+        self.percepts.clear()
+
+    def shutdown(self):
+        if self.planner:
+            self.planner.shutdown()
+            self.planner = None
+
+
+PERCEPTION = Perception()
@@ -0,0 +1,103 @@
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Future, ProcessPoolExecutor
+from math import inf
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from game_components.constants import FactionsConst
+
+if TYPE_CHECKING:
+    from game_components.character.abc import CharacterABC
+
+__all__ = ['AIPlanner', 'plan_targets']
+
+# factions are sent to workers as small ints
+FACTION_CODES: Dict[str, int] = {faction: code for code, faction in enumerate(FactionsConst.All)}
+
+
+def find_nearest_row(agent: int, xs: array, ys: array, factions: bytes, order: List[int], sorted_xs: List[float],
+                     wanted: frozenset) -> int:
+    x, y = xs[agent], ys[agent]
+    nearest, nearest_dist = -1, inf
+    right = bisect_left(sorted_xs, x)
+    left = right - 1
+    # walks away from the agent by x until x distance alone is farther than the nearest found
+    while left >= 0 or right < len(order):
+        left_dx = x - sorted_xs[left] if left >= 0 else inf
+        right_dx = sorted_xs[right] - x if right < len(order) else inf
+        if left_dx < right_dx:
+            dx, row = left_dx, order[left]
+            left -= 1
+        else:
+            dx, row = right_dx, order[right]
+            right += 1
+        if dx > nearest_dist:
+            break
+        if row != agent and factions[row] in wanted:
+            row_dist = (dx * dx + (ys[row] - y) ** 2) ** 0.5
+            if row_dist < nearest_dist:
+                nearest, nearest_dist = row, row_dist
+    return nearest
+
+
+def plan_targets(xs: array, ys: array, factions: bytes, agents: array, enemies: Dict[int, frozenset]) -> array:
+    # runs in worker processes, gets only plain data: returns rows of the nearest enemy
+    # for every agent row, -1 when there is none
+    order = sorted(range(len(xs)), key=xs.__getitem__)
+    sorted_xs = [xs[row] for row in order]
+    nearest_enemies = array('i')
+    for agent in agents:
+        nearest_enemies.append(find_nearest_row(agent, xs, ys, factions, order, sorted_xs, enemies[factions[agent]]))
+    return nearest_enemies
+
+
+class AIPlanner:
+    # nearest enemy search is sent to worker processes with a compact snapshot of positions and factions,
+    # every snapshot is tagged with its step, so the caller could drop plans which are too old.
+    # A new snapshot is not sent while the previous one is planned, so slow workers are skipped instead of queued
+    def __init__(self, workers: int, enemies: Dict[str, Tuple[str, ...]]):
+        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=workers)
+        self.enemies: Dict[int, frozenset] = self.encode_relations(enemies)
+        self.future: Optional[Future] = None
+        self.step: int = 0  # step of the snapshot being planned
+        self.rows: List['CharacterABC'] = []  # characters of the snapshot being planned by rows
+        self.agents: List['CharacterABC'] = []
+
+    @staticmethod
+    def encode_relations(relations: Dict[str, Tuple[str, ...]]) -> Dict[int, frozenset]:
+        return {FACTION_CODES[faction]: frozenset(FACTION_CODES[other] for other in others)
+                for faction, others in relations.items()}
+
+    def plan(self, step: int, characters: Iterable['CharacterABC'], agents: Iterable['CharacterABC']):
+        if self.future is not None:
+            return
+
+        self.rows = [character for character in characters if character.alive]
+        rows_by_character = {character: row for row, character in enumerate(self.rows)}
+        self.agents = [agent for agent in agents if agent in rows_by_character]
+        if not self.agents:
+            return
+
+        xs, ys = array('d'), array('d')
+        for character in self.rows:
+            x, y = character.position
+            xs.append(x)
+            ys.append(y)
+        factions = bytes(FACTION_CODES[character.faction] for character in self.rows)
+        agents_rows = array('i', (rows_by_character[agent] for agent in self.agents))
+        self.step = step
+        self.future = self.executor.submit(plan_targets, xs, ys, factions, agents_rows, self.enemies)
+
+    def collect(self) -> Optional[Tuple[int, Dict['CharacterABC', Optional['CharacterABC']]]]:
+        # step of the snapshot and nearest enemy by agent when planning is finished, None while it is running
+        if self.future is None or not self.future.done():
+            return None
+
+        future, self.future = self.future, None
+        rows = self.rows
+        return self.step, {agent: rows[enemy] if enemy >= 0 else None
+                           for agent, enemy in zip(self.agents, future.result())}
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.future = None
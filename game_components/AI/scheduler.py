@@ -0,0 +1,45 @@
+from math import ceil
+
+from game_components.AI.base import BaseAI
+from game_components.global_data import GD
+
+__all__ = ['AIScheduler']
+
+
+class AIScheduler:
+    # AI with a foreground task (fights, interactions) is ticked every step. Background AI (walking, cheering)
+    # is ticked round-robin: every step a window moves over background AI in the order they are met and
+    # ticks 1/background_interval of them, but never more than background_budget, with the accumulated dt
+    def __init__(self, background_interval: int = None, background_budget: int = None):
+        self.background_interval: int = GD.ai_background_interval if background_interval is None \
+            else background_interval
+        self.background_budget: int = GD.ai_background_budget if background_budget is None else background_budget
+        self.step: int = 0
+        self.seen: int = 0  # background AI met during the current step
+        self.total: int = 0  # background AI met during the previous step
+        self.cursor: int = 0
+        self.window: int = 0
+
+    def next_step(self):
+        self.step += 1
+        # the cursor carries over, so AI left out by the budget are ticked first on next steps
+        if self.total:
+            self.cursor = (self.cursor + self.window) % self.total
+        self.total, self.seen = self.seen, 0
+        self.window = ceil(self.total / self.background_interval)
+        if self.background_budget:
+            self.window = min(self.window, self.background_budget)
+
+    def update(self, ai: BaseAI, dt: float, time: float, game_obj) -> bool:
+        ai.accumulated_dt += dt
+        if ai.is_background:
+            index, self.seen = self.seen, self.seen + 1
+            if self.total:
+                if (index - self.cursor) % self.total >= self.window:
+                    return False
+            elif self.background_budget and index >= self.background_budget:
+                return False
+
+        dt, ai.accumulated_dt = ai.accumulated_dt, 0
+        ai.update(dt=dt, time=time, game_obj=game_obj)
+        return True
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+__all__ = ['LRUCache']
+
+
+class LRUCache:
+    def __init__(self, max_size: int = 128, max_memory: Optional[int] = None,
+                 get_item_memory: Optional[Callable[[Any], int]] = None):
+        self.max_size: int = max_size
+        self.max_memory: Optional[int] = max_memory
+        self.get_item_memory: Optional[Callable[[Any], int]] = get_item_memory
+        self.data: OrderedDict = OrderedDict()
+        self.memory: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[Any]:
+        if key in self.data:
+            self.hits += 1
+            self.data.move_to_end(key)
+            return self.data[key]
+
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        if key in self.data:
+            self.memory -= self.get_memory(self.data.pop(key))
+        self.data[key] = value
+        self.memory += self.get_memory(value)
+
+        while len(self.data) > self.max_size or (self.max_memory is not None
+                                                 and self.memory > self.max_memory and len(self.data) > 1):
+            _, evicted = self.data.popitem(last=False)
+            self.memory -= self.get_memory(evicted)
+        return value
+
+    def get_memory(self, value: Any) -> int:
+        return self.get_item_memory(value) if self.get_item_memory else 0
+
+    def clear(self):
+        self.data.clear()
+        self.memory = self.hits = self.misses = 0
+
+    @property
+    def stats(self) -> dict:
+        return {'size': len(self.data), 'memory': self.memory, 'hits': self.hits, 'misses': self.misses}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
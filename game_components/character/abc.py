@@ -5,14 +5,20 @@ from pygame import Surface, Color, Rect
 
 from game_components.global_data import GD
 from game_components.constants import *
-from game_components.screen import MAIN_DISPLAY
+from game_components.screen import SCREEN_W, SCREEN_H
 from game_components.weapon.base import BaseWeapon
+from game_components.physics import PHYSICS_BATCHED, PHYSICS_SLOTS, install_physics_fields
 
 __all__ = ['CharacterABC']
 
 
 class CharacterABC:
+    __slots__ = ('physics_store', 'physics_row', 'name', '_draw_name_flag', 'kind', 'state', 'is_player',
+                 'w_size', 'h_size', 'max_health_points', 'health_points', 'weapon', 'rect',
+                 '_body_color', '_eyes_color', 'make_ghost', 'alive', 'draw_over', 'death_reason',
+                 'spatial_index', 'rest_tracker', 'rest_time', 'visual_part') + PHYSICS_SLOTS
     attrs_const = AttrsCons
+    generation: int = 0  # only pooled characters are respawned, see Zombie
     states_const = StatesConst
 
     def __init__(self, position: PosType,
@@ -36,6 +42,9 @@ class CharacterABC:
                  *_,
                  **__,
                  ):
+        self.physics_store: Optional['PhysicsStore'] = None
+        self.physics_row: Optional[int] = None
+
         self.name: str = name.lower()
         self._draw_name_flag: bool = draw_name
         self.kind: str = kind
@@ -44,7 +53,8 @@ class CharacterABC:
 
         self.w_size: int = w_size
         self.h_size: int = h_size
-        self._position: List = list(position)
+        self.position_x: float = position[0]
+        self.position_y: float = position[1]
         self.rotation_speed: float = DEFAULT_ROTATION_SPEED * random.random()
         self.angle: float = 0
 
@@ -55,6 +65,8 @@ class CharacterABC:
         self.weapon: Optional[BaseWeapon] = weapon
 
         self.rect: Rect = Rect(position, self.size)
+        self.previous_x: float = self.rect.x
+        self.previous_y: float = self.rect.y
         if move_direction is None:
             move_direction = random.randint(-1, 1)
         self.move_direction: int = move_direction
@@ -74,6 +86,10 @@ class CharacterABC:
         self.death_reason: str = ''
         self.movement_time: float = 0
 
+        self.spatial_index: Optional['SpatialIndex'] = None
+        self.rest_tracker: Optional['RestTracker'] = None
+        self.rest_time: float = 0
+
         self.visual_part: 'CharacterVisual' = None
         self.create_visual_part(hat=hat, glasses=glasses)
         self.render_visual()
@@ -87,6 +103,7 @@ class CharacterABC:
         raise NotImplemented
 
     def damage(self, damage: float, reason: str = ''):
+        self.wake_up()
         self.health_points -= damage
         if self.health_points < 1:
             self.alive = False
@@ -107,37 +124,57 @@ class CharacterABC:
                 self.movement_time += dt
 
             dx = self.horizontal_velocity * dt
-            self._position[0] += self.horizontal_velocity * dt
+            self.position_x += dx
             self.set_look_direction(dx)
-            self.rect.x = self._position[0]
+            self.rect.x = self.position_x
 
-            if self.rect.x > (MAIN_DISPLAY.get_width() - self.w_size):
-                self.rect.x = MAIN_DISPLAY.get_width() - self.w_size
+            if self.rect.x > (SCREEN_W - self.w_size):
+                self.position_x = self.rect.x = SCREEN_W - self.w_size
                 self.move_direction = -1
             elif self.rect.x < 1:
-                self.rect.x = 0
+                self.position_x = self.rect.x = 0
                 self.move_direction = 1
 
+            if self.spatial_index:
+                self.spatial_index.update(self)
+
     def fall(self, dt):
         if self.vertical_velocity or self.is_falling:
-            self._position[1] += self.vertical_velocity * dt
-            self.rect.y = self._position[1]
+            self.position_y += self.vertical_velocity * dt
+            self.rect.y = self.position_y
             self.vertical_velocity += FALL_SPEED * dt
 
             if self.rect.y < -(self.h_size * 2):
-                self._position[1] = -(self.h_size * 2)
-                self.rect.y = self._position[1]
+                self.position_y = -(self.h_size * 2)
+                self.rect.y = self.position_y
                 self.vertical_velocity = 0
-            elif self.rect.y > MAIN_DISPLAY.get_height() - self.h_size:
-                self._position[1] = MAIN_DISPLAY.get_height() - self.h_size
-                self.rect.y = self._position[1]
+            elif self.rect.y > SCREEN_H - self.h_size:
+                self.position_y = SCREEN_H - self.h_size
+                self.rect.y = self.position_y
                 self.vertical_velocity = 0
 
+    def save_previous_position(self):
+        self.previous_x, self.previous_y = self.rect.topleft
+
+    @property
+    def previous_position(self) -> PosType:
+        return self.previous_x, self.previous_y
+
+    def get_interpolation_offset(self, alpha: float) -> PosType:
+        # offset from the current position to the position between previous and current simulation steps
+        k = alpha - 1
+        return (self.rect.x - self.previous_x) * k, (self.rect.y - self.previous_y) * k
+
     def push(self, horizontal_velocity: float = 0, vertical_velocity: float = 0, rotation_speed: float = 0):
+        self.wake_up()
         self.horizontal_velocity += horizontal_velocity
         self.vertical_velocity -= vertical_velocity
         self.rotation_speed += rotation_speed
 
+    def wake_up(self):
+        if self.rest_tracker:
+            self.rest_tracker.wake_up(self)
+
     def set_look_direction(self, direction: Union[int, float]) -> None:
         if direction == 0:
             return
@@ -149,7 +186,22 @@ class CharacterABC:
 
     @property
     def is_falling(self) -> bool:
-        return self.rect.y < MAIN_DISPLAY.get_height() - self.h_size - 1
+        return self.rect.y < SCREEN_H - self.h_size - 1
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.move_direction or self.horizontal_velocity or self.vertical_velocity
+                    or self.rotation_speed or self.is_falling)
+
+    @property
+    def faction(self) -> str:
+        return FactionsConst.Players if self.is_player else FactionsConst.Npcs
+
+    @property
+    def is_settled(self) -> bool:
+        # batched physics keeps settled flags of all characters, calculated in its step
+        settled = not self.is_active if self.physics_store is None else self.physics_store.is_settled(self)
+        return settled and (self.weapon is None or self.weapon.ready_to_use)
 
     @property
     def on_the_ground(self) -> bool:
@@ -191,9 +243,12 @@ class CharacterABC:
 
     @position.setter
     def position(self, position: PosType):
-        self._position[0] = position[0]
-        self._position[1] = position[1]
+        self.position_x = position[0]
+        self.position_y = position[1]
         self.rect.x, self.rect.y = position
+        if self.spatial_index:
+            self.spatial_index.update(self)
+        self.wake_up()
 
     @property
     def x(self) -> int:
@@ -220,3 +275,7 @@ class CharacterABC:
     def eyes_color(self, color:  Color) -> None:
         self._eyes_color = color
         self.visual_part.eyes_color = color
+
+
+if PHYSICS_BATCHED:
+    install_physics_fields(CharacterABC)
@@ -1,14 +1,15 @@
 from math import sin
 from pygame import Color, Surface, transform, draw, Rect
-from typing import Optional, Type
+from typing import Dict, Optional, Type
 
 from game_components import constants as const
 from game_components.character.abc import CharacterABC
 from game_components.character.visual.clothes import Glasses, Hat, Moustache, Clothes
 from game_components.sprite_builder import SpritesBuilder
 from game_components.global_data import GD
-from game_components.screen import MAIN_DISPLAY
-from game_components.utils import DEFAULT_BACK_FONT, add_outline_to_image
+from game_components.render import RENDERER
+from game_components.quality import QUALITY
+from game_components.utils import DEFAULT_BACK_FONT, render_text, get_surface
 
 
 class CharVisualError(Exception):
@@ -16,6 +17,10 @@ class CharVisualError(Exception):
 
 
 class CharacterVisual:
+    __slots__ = ('kind', 'rect', 'state', '_hp_k', 'name', 'name_surface', 'label_surface', 'body_color', 'eyes_color',
+                 'surface', 'mirrored_surface', 'composite_surfaces', 'glasses_name', '_glasses', 'hat_name', '_hat',
+                 'moustache')
+
     def __init__(self, kind: str, rect: Rect,
                  name: str = '',
                  state: str = const.StatesConst.Idle,
@@ -27,21 +32,92 @@ class CharacterVisual:
         self.kind: str = kind
         self.rect: Rect = rect
         self.state: str = state
-        self.hp_k: float = hp_k
+        self._hp_k: float = hp_k
 
         self.name: str = name
         self.name_surface: Surface = None
+        # name and hp bar rendered together, re-rendered only when hp bar width changes
+        self.label_surface: Surface = None
 
         self.body_color: Color = Color(body_color) if body_color else body_color
         self.eyes_color: Color = Color(eyes_color) if eyes_color else eyes_color
 
         self.surface: Surface = None
         self.mirrored_surface: Surface = None
+        # body with clothes baked in, by look direction
+        self.composite_surfaces: Dict[int, Surface] = {}
 
         self.glasses_name: str = glasses
-        self.glasses: Clothes = None
+        self._glasses: Clothes = None
         self.hat_name: str = hat
-        self.hat: Clothes = None
+        self._hat: Clothes = None
+
+    @property
+    def glasses(self) -> Optional[Clothes]:
+        return self._glasses
+
+    @glasses.setter
+    def glasses(self, glasses: Optional[Clothes]):
+        self._glasses = glasses
+        self.invalidate_composite()
+
+    @property
+    def hat(self) -> Optional[Clothes]:
+        return self._hat
+
+    @hat.setter
+    def hat(self, hat: Optional[Clothes]):
+        self._hat = hat
+        self.invalidate_composite()
+
+    @property
+    def hp_k(self) -> float:
+        return self._hp_k
+
+    @hp_k.setter
+    def hp_k(self, hp_k: float):
+        if self.get_hp_bar_width(hp_k) != self.get_hp_bar_width(self._hp_k):
+            self.label_surface = None
+        self._hp_k = hp_k
+
+    @staticmethod
+    def get_hp_bar_width(hp_k: float) -> int:
+        return int((const.HP_BAR_W - 2) * max(hp_k, 0))
+
+    def invalidate_composite(self):
+        self.composite_surfaces.clear()
+
+    def get_composite_surface(self, look_direction: int) -> Surface:
+        look_direction = -1 if look_direction < 0 else 1
+        if look_direction not in self.composite_surfaces:
+            self.composite_surfaces[look_direction] = self.render_composite_surface(look_direction)
+        return self.composite_surfaces[look_direction]
+
+    def render_composite_surface(self, look_direction: int) -> Surface:
+        body = self.surface if look_direction < 0 else self.mirrored_surface
+        clothes = [c for c in (self.glasses, self.hat) if c]
+        if not clothes:
+            return body
+
+        # composite is centered on the body center, so it could be rotated as a single surface
+        body_w, body_h = body.get_size()
+        half_w, half_h = body_w / 2, body_h / 2
+        clothes_positions = []
+        for clothes_part in clothes:
+            x, y = clothes_part.get_position(body_size=(body_w, body_h), look_direction=look_direction)
+            clothes_positions.append((x, y))
+            w, h = clothes_part.surface.get_size()
+            half_w = max(half_w, body_w / 2 - x, x + w - body_w / 2)
+            half_h = max(half_h, body_h / 2 - y, y + h - body_h / 2)
+
+        half_w, half_h = int(half_w) + 1, int(half_h) + 1
+        dx, dy = half_w - body_w // 2, half_h - body_h // 2
+        composite = get_surface(half_w * 2, half_h * 2, transparent=1)
+        composite.blit(body, (dx, dy))
+        for clothes_part, (x, y) in zip(clothes, clothes_positions):
+            composite.blit(clothes_part.surface, (x + dx, y + dy))
+
+        return composite
 
     def render_glasses(self):
         self.render_clothes_part(class_=Glasses, name=self.glasses_name)
@@ -73,31 +149,38 @@ class CharacterVisual:
         setattr(self, class_.type, class_(size=size, position=position_k))
 
     def render_surface(self):
-        self.surface = SpritesBuilder.get_character_body_img(kind=self.kind, size=self.size, state=self.state)
-        if self.body_color:
-            self.surface = SpritesBuilder.recolor_surface(surface=self.surface,
-                                                          kind=self.kind,
-                                                          state=self.state,
-                                                          color_key=SpritesBuilder.RecolorKeys.BODY_COLOR_KEY,
-                                                          new_color=self.body_color)
-        if self.eyes_color:
-            self.surface = SpritesBuilder.recolor_surface(surface=self.surface,
-                                                          kind=self.kind,
-                                                          state=self.state,
-                                                          color_key=SpritesBuilder.RecolorKeys.EYES_COLOR_KEY,
-                                                          new_color=self.eyes_color)
-
-        self.mirrored_surface = transform.flip(self.surface, flip_x=True, flip_y=False)
+        self.surface, self.mirrored_surface = SpritesBuilder.get_recolored_body(kind=self.kind,
+                                                                               state=self.state,
+                                                                               size=self.size,
+                                                                               body_color=self.body_color,
+                                                                               eyes_color=self.eyes_color)
+        self.invalidate_composite()
 
     def render_name_surface(self):
         if self.name:
-            name_surface = DEFAULT_BACK_FONT.render(self.name, True, 'white')
-            name_surface = add_outline_to_image(name_surface)
+            name_surface = render_text(self.name, font_=DEFAULT_BACK_FONT)
             size = name_surface.get_size()
             self.name_surface: Surface = transform.smoothscale(name_surface, [size[0] * 0.75, size[1]])
+        self.label_surface = None
+
+    def render_label_surface(self):
+        self.label_surface = self.render_label(self.get_hp_bar_width(self.hp_k))
+
+    def render_label(self, hp_bar_width: int) -> Surface:
+        name_w, name_h = self.name_surface.get_size() if self.name_surface else (0, const.HP_BAR_H - 2)
+        w = max(name_w, const.HP_BAR_W)
+        label = get_surface(w, name_h + 2, transparent=1)
+        if self.name_surface:
+            label.blit(self.name_surface, (w // 2 - name_w // 2, 0))
 
-    def draw(self, character: CharacterABC):
-        position = list(self.rect.center)
+        x, y = w // 2 - const.HP_BAR_W // 2, name_h - const.HP_BAR_H + 2
+        draw.rect(label, const.HP_BAR_BORDER_COLOR, [[x, y], [const.HP_BAR_W, const.HP_BAR_H]], 0, 2)
+        draw.rect(label, const.HP_BAR_COLOR, [[x + 1, y + 1], [hp_bar_width, const.HP_BAR_H - 2]], 0, 2)
+        return label
+
+    def draw(self, character: CharacterABC, alpha: float = 1.):
+        offset_x, offset_y = character.get_interpolation_offset(alpha)
+        position = [character.rect.centerx + offset_x, character.rect.centery + offset_y]
 
         if character.horizontal_velocity != 0 and not character.is_falling:
             dy = sin(character.movement_time * 8) * character.h_size * 0.05
@@ -105,53 +188,73 @@ class CharacterVisual:
         else:
             dy = 0
 
-        surface = self.surface if character.move_direction < 0 else self.mirrored_surface
         if character.angle:
-            surface = transform.rotate(surface, character.angle)
+            if QUALITY.rotate_clothes:
+                surface = self.get_composite_surface(character.look_direction)
+            else:
+                # bare body surfaces are shared, so their rotations are mostly cached already
+                surface = self.surface if character.look_direction < 0 else self.mirrored_surface
+            surface = SpritesBuilder.get_rotated_surface(surface, character.angle, step=QUALITY.rotation_step)
+        else:
+            surface = self.get_composite_surface(character.look_direction)
 
         position[0] -= surface.get_width() // 2
         position[1] += dy - surface.get_height() // 2
 
-        MAIN_DISPLAY.blit(surface, position)
-
-        if self.glasses:
-            self.glasses.draw(character=character,
-                              body_surface_pos=position,
-                              body_surface_size=surface.get_size())
-
-        if self.hat:
-            self.hat.draw(character=character,
-                          body_surface_pos=position,
-                          body_surface_size=surface.get_size())
+        RENDERER.blit(surface, position)
 
-        self.draw_name(dy=dy)
-
-        self.draw_hp_bar(dy=dy)
+        if character.is_player or QUALITY.draw_npc_labels:
+            self.draw_label(character, dx=offset_x, dy=dy + offset_y)
 
         if character.weapon:
             character.weapon.draw()
 
-    def draw_name(self, dy: int):
-        if self.name_surface:
-            name_pos = self.get_name_position(dy=dy)
-            MAIN_DISPLAY.blit(self.name_surface, name_pos)
-
-    def get_name_position(self, dy: float = 0.) -> const.PosType:
-        x_0, y_0 = self.rect.midtop
-        x = x_0 - self.name_surface.get_width() // 2
-        y = y_0 - self.name_surface.get_height() + dy
-        return x, y
+    def draw_label(self, character: CharacterABC, dx: float = 0., dy: float = 0.):
+        label = self.get_label_surface(character)
+        RENDERER.blit(label, self.get_label_position(label, rect=character.rect, dx=dx, dy=dy))
 
-    def draw_hp_bar(self, dy: int):
-        # TODO probably better to render once
-        x, y = self.rect.midtop
-        y += dy - const.HP_BAR_H + 2
-        x -= const.HP_BAR_W // 2
+    def get_label_surface(self, character: CharacterABC) -> Surface:
+        if self.label_surface is None:
+            self.render_label_surface()
+        return self.label_surface
 
-        draw.rect(MAIN_DISPLAY, const.HP_BAR_BORDER_COLOR, [[x, y], [const.HP_BAR_W, const.HP_BAR_H]], 0, 2)
-        hp_w = (const.HP_BAR_W - 2) * self.hp_k
-        draw.rect(MAIN_DISPLAY, const.HP_BAR_COLOR, [[x + 1, y + 1], [hp_w, const.HP_BAR_H - 2]], 0, 2)
+    @staticmethod
+    def get_label_position(label: Surface, rect: Rect, dx: float = 0., dy: float = 0.) -> const.PosType:
+        x_0, y_0 = rect.midtop
+        x = x_0 - label.get_width() // 2 + dx
+        y = y_0 - label.get_height() + 2 + dy
+        return x, y
 
     @property
     def size(self) -> const.SizeType:
         return self.rect.size
+
+
+class SharedVisual(CharacterVisual):
+    # flyweight visual drawn for many nameless characters with the same kind and palette, per character
+    # data (position, hp) is taken from the drawn character and hp labels are shared by hp bar width
+    __slots__ = ('labels',)
+
+    def __init__(self, kind: str, size: const.SizeType,
+                 body_color: Optional[Color] = const.DEFAULT_BODY_COLOR,
+                 eyes_color: Optional[Color] = const.DEFAULT_EYES_COLOR):
+        super().__init__(kind=kind, rect=Rect((0, 0), size), body_color=body_color, eyes_color=eyes_color)
+        self.labels: Dict[int, Surface] = {}
+
+    @property
+    def hp_k(self) -> float:
+        return 1.
+
+    @hp_k.setter
+    def hp_k(self, hp_k: float):
+        pass  # hp is read from the drawn character
+
+    def get_label_surface(self, character: CharacterABC) -> Surface:
+        hp_bar_width = self.get_hp_bar_width(character.health_points / character.max_health_points)
+        label = self.labels.get(hp_bar_width)
+        if label is None:
+            label = self.labels[hp_bar_width] = self.render_label(hp_bar_width)
+        return label
+
+    def render_name_surface(self):
+        self.labels.clear()
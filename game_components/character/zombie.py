@@ -1,15 +1,24 @@
 import random
 from pygame import Color
+from typing import Dict, List, Tuple
 from uuid import uuid1
 from game_components.character.user_character import Character
-from game_components.constants import PosType, DEFAULT_HP, MOVE_SPEED
+from game_components.character.visual.base import SharedVisual
+from game_components.constants import PosType, SizeType, DEFAULT_HP, MOVE_SPEED, DEFAULT_ROTATION_SPEED, FactionsConst, \
+    StatesConst
+from game_components.global_data import GD
+from game_components.singletone_decorator import single_tone_decorator
 from game_components.weapon.fist import Fists
 from game_components.AI.base import BaseAI, FindTarget, TaskState, GoTo, IdleWalk
 from game_components.AI.go_and_kill import GoAndKill
 
 
 class Zombie(Character):
+    __slots__ = ('destruction_enabled', '__destruction_damage', 'generation')
     DEFAULT_NAME = 'zombie'
+    faction = FactionsConst.Zombies
+    # nameless zombies of the same kind are drawn with one visual
+    shared_visuals: Dict[Tuple[str, SizeType], SharedVisual] = {}
 
     def __init__(self, position: PosType, kind: str = 'cat', name=DEFAULT_NAME):
         super().__init__(position=position,
@@ -22,8 +31,53 @@ class Zombie(Character):
                          body_color=Color(200, 200, 250), eyes_color=Color('red'),
                          weapon=Fists(position))
         self.destruction_enabled: bool = False
+        self.generation: int = 0  # incremented on every respawn
         self.__destruction_damage = self.max_health_points / random.randrange(5, 10)
 
+    def create_visual_part(self, hat: str = None, glasses: str = None):
+        if self._draw_name_flag or hat or glasses:
+            return super().create_visual_part(hat=hat, glasses=glasses)
+
+        key = self.kind, self.size
+        if key not in self.shared_visuals:
+            self.shared_visuals[key] = SharedVisual(kind=self.kind, size=self.size,
+                                                    body_color=self.body_color, eyes_color=self.eyes_color)
+        self.visual_part = self.shared_visuals[key]
+
+    def render_visual(self):
+        if not isinstance(self.visual_part, SharedVisual) or self.visual_part.surface is None:
+            super().render_visual()
+
+    def respawn(self, position: PosType, kind: str, name: str = DEFAULT_NAME):
+        # brings a pooled zombie back to life, must be called when it is not added to the game
+        self.generation += 1
+        self.name = name.lower()
+        self._draw_name_flag = name != self.DEFAULT_NAME
+        self.kind = kind
+        self.state = StatesConst.Idle
+        self.alive = True
+        self.death_reason = ''
+        self.health_points = self.max_health_points
+        self.destruction_enabled = False
+        self.draw_over.clear()
+
+        self.position_x, self.position_y = position
+        self.rect.topleft = position
+        self.save_previous_position()
+        self.horizontal_velocity = 0
+        self.vertical_velocity = 0.1
+        self.rotation_speed = DEFAULT_ROTATION_SPEED * random.random()
+        self.angle = 0
+        self.move_direction = 1
+        self.look_direction = 1
+        self.movement_time = 0
+        self.rest_time = 0
+        self.weapon.set_cooldown(0)
+        self.weapon.position = position
+
+        self.create_visual_part()
+        self.render_visual()
+
     def update(self, dt: float, time: float):
         super().update(dt=dt, time=time)
 
@@ -43,6 +97,12 @@ class ZombieAI(BaseAI):
         self.go_and_kill_timeout: float = 0
         self.walk_timeout: float = 10
 
+    def reset(self):
+        self.clear()
+        self.go_and_kill_timeout = 0
+        self.walk_timeout = 10
+        self.accumulated_dt = 0
+
     def update(self, dt: float, time: float, game_obj) -> None:
         tick_result = None
         if self.tasks_queue:
@@ -83,11 +143,76 @@ class ZombieAI(BaseAI):
 
     @staticmethod
     def get_find_target_zombie_task() -> FindTarget:
-        return FindTarget(filter_func=lambda target: not isinstance(target, Zombie) and target.alive)
+        return FindTarget()
+
+
+@single_tone_decorator
+class ZombiePool:
+    # removed zombies are kept with their AI and id and brought back by next infections,
+    # so an outbreak does not allocate a character, a weapon and a visual for every new zombie.
+    # Released zombies are reused only after recycle() at the end of the simulation step,
+    # so tasks of the step which killed them still see them dead
+    def __init__(self, max_size: int = None):
+        self.max_size: int = GD.zombie_pool_size if max_size is None else max_size
+        self.free: List[Tuple[str, Zombie, ZombieAI]] = []
+        self.released: List[Tuple[str, Zombie, ZombieAI]] = []
+        self.reused: int = 0
+
+    def acquire(self, position: PosType, name: str = Zombie.DEFAULT_NAME,
+                kind: str = 'cat') -> Tuple[str, Zombie, ZombieAI]:
+        if self.free:
+            zombie_id, zombie, ai = self.free.pop()
+            zombie.respawn(position=position, kind=kind, name=name)
+            ai.reset()
+            self.reused += 1
+            return zombie_id, zombie, ai
+
+        zombie = Zombie(name=name, position=position, kind=kind)
+        return str(uuid1()), zombie, ZombieAI(zombie=zombie)
+
+    def release(self, zombie_id: str, zombie: Zombie, ai: ZombieAI):
+        if isinstance(ai, ZombieAI) and len(self.free) + len(self.released) < self.max_size:
+            ai.reset()
+            self.released.append((zombie_id, zombie, ai))
+
+    def recycle(self):
+        if self.released:
+            self.free.extend(self.released)
+            self.released.clear()
+
+    def clear(self):
+        self.free.clear()
+        self.released.clear()
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+
+ZOMBIE_POOL = ZombiePool()
 
 
 def add_zombie(position: PosType, game_obj, name: str = Zombie.DEFAULT_NAME, kind: str = 'cat'):
-    zombie_id: str = str(uuid1())
-    zombie = Zombie(name=name, position=position, kind=kind)
-    game_obj.characters[zombie_id] = zombie
-    game_obj.characters_AI[zombie_id] = ZombieAI(zombie=zombie)
+    zombie_id, zombie, ai = ZOMBIE_POOL.acquire(position=position, name=name, kind=kind)
+    game_obj.add_character_object(zombie_id, character=zombie, ai=ai)
+
+
+if __name__ == '__main__':
+    import tracemalloc
+    from game_components.game import Game
+    # classes of this module run as __main__ differ from the ones the game checks
+    from game_components.character.zombie import Zombie, ZOMBIE_POOL, add_zombie
+
+    game = Game()
+    outbreak = 200
+    for wave in range(3):
+        # the first wave fills the pool, next waves should be taken from it
+        tracemalloc.start()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        for i in range(outbreak):
+            add_zombie(position=(i, 0), game_obj=game)
+        memory = tracemalloc.get_traced_memory()[0] - start_memory
+        tracemalloc.stop()
+        print(f'wave {wave}: {memory / outbreak:.0f} bytes per zombie, {ZOMBIE_POOL.reused} reused')
+        for uid in [uid for uid, character in game.characters.items() if isinstance(character, Zombie)]:
+            game.remove_character(uid)
+        ZOMBIE_POOL.recycle()  # done at the end of every simulation step
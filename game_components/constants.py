@@ -16,6 +16,23 @@ DEFAULT_BODY_COLOR = (100, 100, 100)
 DEFAULT_EYES_COLOR = (0, 0, 0)
 DEFAULT_HP = 100
 DEFAULT_ROTATION_SPEED = 5
+ROTATION_STEP = 5
+ROTATION_CACHE_SIZE = 2048
+ROTATION_CACHE_MEMORY = 64 * 1024 * 1024
+FULL_REDRAW_THRESHOLD = 0.5
+SIMULATION_STEP = 1 / 60
+MAX_SIMULATION_STEPS = 5
+MAX_FRAME_TIME = 0.25
+AI_BACKGROUND_INTERVAL = 4  # background AI is ticked once per this number of simulation steps
+AI_BACKGROUND_BUDGET = 250  # background AI ticks per simulation step at most, 0 is not limited
+REST_DELAY = 0.5  # seconds a character has to stay settled before it is put to sleep
+ZOMBIE_POOL_SIZE = 256  # dead zombies kept for reuse
+AI_WORKERS = 0  # processes planning AI targets, 0 plans on the main thread
+IDLE_FPS = 10
+IDLE_DELAY = 1.
+QUALITY_SAMPLES = 60
+QUALITY_DEGRADE_K = 0.9
+QUALITY_RESTORE_K = 0.5
 
 HP_BAR_W = CHAR_SIZE // 2
 HP_BAR_H = 5
@@ -60,3 +77,10 @@ class AttrsCons(enum.Enum):
 class StatesConst:
     Idle = 'idle'
     Sleeping: str = 'sleeping'
+
+
+class FactionsConst:
+    Players = 'players'
+    Zombies = 'zombies'
+    Npcs = 'npcs'
+    All = (Players, Zombies, Npcs)
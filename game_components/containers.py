@@ -0,0 +1,165 @@
+from typing import Generic, Hashable, List, Set, Tuple, TypeVar
+
+__all__ = ['EntityDict', 'DeferredList']
+
+T = TypeVar('T')
+
+
+class EntityDict(dict):
+    # dict with a cached snapshot of its items, so it could be changed while iterating the snapshot,
+    # the snapshot is rebuilt only on the first iteration after a change, not every frame
+    __slots__ = ('generation', 'snapshot_generation', 'items_snapshot')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.generation: int = 0
+        self.snapshot_generation: int = -1
+        self.items_snapshot: Tuple[Tuple[Hashable, object], ...] = ()
+
+    def snapshot(self) -> Tuple[Tuple[Hashable, object], ...]:
+        if self.snapshot_generation != self.generation:
+            self.items_snapshot = tuple(self.items())
+            self.snapshot_generation = self.generation
+        return self.items_snapshot
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.generation += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.generation += 1
+
+    def pop(self, *args):
+        self.generation += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.generation += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.generation += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.generation += 1
+
+    def clear(self):
+        super().clear()
+        self.generation += 1
+
+
+class DeferredList(Generic[T]):
+    # list which could be changed while it is iterated inside deferred(): items added or removed
+    # during iteration are kept aside and applied on exit, removed items are compacted by swapping
+    # two lists instead of a list.remove call per item
+    __slots__ = ('items', 'spare', 'added', 'removed', 'locks')
+
+    def __init__(self):
+        self.items: List[T] = []
+        self.spare: List[T] = []
+        self.added: List[T] = []
+        self.removed: Set[T] = set()
+        self.locks: int = 0
+
+    def deferred(self) -> 'DeferredList[T]':
+        self.locks += 1
+        return self
+
+    def __enter__(self) -> 'DeferredList[T]':
+        return self
+
+    def __exit__(self, *_):
+        self.locks -= 1
+        if not self.locks:
+            self.apply()
+
+    def append(self, item: T):
+        if self.locks:
+            self.added.append(item)
+        else:
+            self.items.append(item)
+
+    def remove(self, item: T):
+        self.removed.add(item)
+        if not self.locks:
+            self.apply()
+
+    def apply(self):
+        if self.removed:
+            spare = self.spare
+            for item in self.items:
+                if item not in self.removed:
+                    spare.append(item)
+            for item in self.added:
+                if item not in self.removed:
+                    spare.append(item)
+            self.items.clear()
+            self.items, self.spare = spare, self.items
+            self.removed.clear()
+        elif self.added:
+            self.items.extend(self.added)
+        self.added.clear()
+
+    def clear(self):
+        self.items.clear()
+        self.added.clear()
+        self.removed.clear()
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self.items
+
+    def __getitem__(self, index: int) -> T:
+        return self.items[index]
+
+
+if __name__ == '__main__':
+    import subprocess
+    import sys
+    import tracemalloc
+
+    budget = 1024  # bytes allocated on top of live objects by an average simulation step
+    frames = 300
+    if len(sys.argv) < 2:
+        # physics mode is chosen on import, so every mode is measured in its own process
+        exit_codes = [subprocess.run([sys.executable, '-m', 'game_components.containers', mode]).returncode
+                      for mode in ('per_character', 'batched')]
+        sys.exit(max(exit_codes))
+
+    from game_components.global_data import GD
+    GD.config['physics'] = {'batched': sys.argv[1] == 'batched'}
+    from game_components.game import Game
+    from game_components.physics import PHYSICS_BATCHED
+
+    game = Game()
+    for i in range(50):
+        game.add_character(f'character {i}')
+        game.get_character_ai(f'character {i}').run_idle_walking()
+    for _ in range(60):
+        game.simulate(1 / 60)
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(frames):
+        start_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        game.simulate(1 / 60)
+        peaks.append(tracemalloc.get_traced_memory()[1] - start_memory)
+    tracemalloc.stop()
+
+    average = sum(peaks) / frames
+    print(f'{"batched" if PHYSICS_BATCHED else "per character"} physics: {average:.0f} bytes per step on average, '
+          f'{max(peaks)} at most, budget {budget}: {"ok" if average <= budget else "over budget"}')
+    # non zero exit code when allocations go over the budget
+    sys.exit(0 if average <= budget else 1)
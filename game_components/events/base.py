@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import List, Optional, Dict
+from itertools import islice
+from typing import Optional, Dict, ValuesView
 import random
 
 from game_components.character.user_character import Character
@@ -25,12 +26,13 @@ class BaseEvent:
         pass
 
     @property
-    def characters(self) -> List[Character]:
-        return list(self.characters_dict.values())
+    def characters(self) -> ValuesView[Character]:
+        # live view, not a copy
+        return self.characters_dict.values()
 
     def get_random_character(self) -> Optional[Character]:
-        if self.characters:
-            return random.choice(self.characters)
+        if self.characters_dict:
+            return next(islice(self.characters_dict.values(), random.randrange(len(self.characters_dict)), None))
         else:
             return None
 
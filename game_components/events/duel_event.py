@@ -11,8 +11,10 @@ from game_components.AI.cheer import Cheer
 from game_components.AI.base import AI, GoTo, IdleWalk
 from game_components.AI.go_and_kill import GoAndKill
 from game_components.screen import scaled_w, SCREEN_H, MAIN_DISPLAY
-from game_components.utils import FONT_25_px, load_image, add_outline_to_image, DEFAULT_FONT
+from game_components.render import RENDERER
+from game_components.utils import FONT_25_px, load_image, render_text
 from game_components.sounds import play_sound
+from game_components.timers import Timer
 
 PREPARE_TIME = 60
 DUEL_TIME = 45
@@ -86,40 +88,49 @@ class DuelEvent(BaseEvent, EventPredictionMixin):
                 ai.add_task(GoTo(pos))
                 ai.add_task(Cheer(event_to_follow=self, direction_to_look=-1))
 
-        self.prepare_timer: float = PREPARE_TIME
+        self.prepare_deadline: float = self.global_data.time + PREPARE_TIME
         self.preparing_stage: bool = True
         self.prepare_stage_text_render_time: int = int(self.prepare_timer)
         self.prepare_stage_surface: Surface = self.get_preparing_stage_surface()
 
-        self.duel_timer: float = DUEL_TIME
+        self.duel_deadline: Optional[float] = None
         self.fight_stage: bool = False
         self.fight_stage_text_render_time: int = int(self.prepare_timer)
         self.fight_stage_surface: Surface = self.get_duel_stage_surface()
         self.title_text_surface: Surface = self.get_title_text_surface()
         self.title_text_surface_pos: tuple = MAIN_DISPLAY.get_rect().midtop[0]-self.title_text_surface.get_width()//2, 0
 
-        self.update_stage: Callable = self.prepare_stage_update
+        self.stage_timer: Timer = self.global_data.timers.add_at(self.prepare_deadline, self.start_fight)
         self.winner: Character = None
 
-    def prepare_stage_update(self, dt: float):
-        self.prepare_timer -= dt
-        if self.prepare_timer <= 0.:
-            self.preparing_stage = False
-            self.lock_prediction()
-            LOGGER.info(f'Locked prediction')
-            self.fight_stage = True
-            LOGGER.info(f'Started fight between {self.duelist_1.name} and {self.duelist_2.name}')
+    @property
+    def prepare_timer(self) -> float:
+        return max(self.prepare_deadline - self.global_data.time, 0.)
 
-            self.duelist_1_ai.clear()
-            self.duelist_1_ai.add_task(GoAndKill(self.duelist_2))
-            self.duelist_2_ai.clear()
-            self.duelist_2_ai.add_task(GoAndKill(self.duelist_1))
-            play_sound(BATTLE_HORN_SOUND)
-            self.update_stage = self.update_duel_stage
+    @property
+    def duel_timer(self) -> float:
+        if self.duel_deadline is None:
+            return DUEL_TIME
+        return max(self.duel_deadline - self.global_data.time, 0.)
+
+    def start_fight(self):
+        self.preparing_stage = False
+        self.lock_prediction()
+        LOGGER.info(f'Locked prediction')
+        self.fight_stage = True
+        LOGGER.info(f'Started fight between {self.duelist_1.name} and {self.duelist_2.name}')
 
-    def update_duel_stage(self, dt: float):
-        self.duel_timer -= dt
+        self.duelist_1_ai.clear()
+        self.duelist_1_ai.add_task(GoAndKill(self.duelist_2))
+        self.duelist_2_ai.clear()
+        self.duelist_2_ai.add_task(GoAndKill(self.duelist_1))
+        play_sound(BATTLE_HORN_SOUND)
+        self.duel_deadline = self.global_data.time + DUEL_TIME
+        self.stage_timer = self.global_data.timers.add_at(self.duel_deadline, self.finish_by_time)
+
+    def update_duel_stage(self):
         if self.duelist_1.dead or self.duelist_2.dead:
+            self.stage_timer.cancel()
             if self.duelist_1.dead and self.duelist_2.dead:
                 LOGGER.info(f'Duel result: draw between {self.duelist_1.name} and {self.duelist_2.name}')
                 self.cancel_prediction(reason='Нічия!')
@@ -135,23 +146,28 @@ class DuelEvent(BaseEvent, EventPredictionMixin):
                 self.is_done = True
                 self.winner = self.duelist_1
 
-        elif self.duel_timer <= 0:
-            if self.duelist_1.health_points == self.duelist_2.health_points:
-                LOGGER.info(f'Duel result: draw between {self.duelist_1.name} and {self.duelist_2.name}')
-                self.cancel_prediction(reason='Нічия!')
-            elif self.duelist_1.health_points < self.duelist_2.health_points:
-                LOGGER.info(f'Duel result: between {self.duelist_1.name} and {self.duelist_2.name}(winner)')
-                self.end_prediction(winner=self.duelist_2.name)
-                self.winner = self.duelist_2
-            else:
-                LOGGER.info(f'Duel result: between {self.duelist_1.name}(winner) and {self.duelist_2.name}')
-                self.end_prediction(winner=self.duelist_1.name)
-                self.winner = self.duelist_1
+    def finish_by_time(self):
+        if self.duelist_1.health_points == self.duelist_2.health_points:
+            LOGGER.info(f'Duel result: draw between {self.duelist_1.name} and {self.duelist_2.name}')
+            self.cancel_prediction(reason='Нічия!')
+        elif self.duelist_1.health_points < self.duelist_2.health_points:
+            LOGGER.info(f'Duel result: between {self.duelist_1.name} and {self.duelist_2.name}(winner)')
+            self.end_prediction(winner=self.duelist_2.name)
+            self.winner = self.duelist_2
+        else:
+            LOGGER.info(f'Duel result: between {self.duelist_1.name}(winner) and {self.duelist_2.name}')
+            self.end_prediction(winner=self.duelist_1.name)
+            self.winner = self.duelist_1
+
+        self.is_done = True
 
-            self.is_done = True
+    def finish(self):
+        self.stage_timer.cancel()
+        super().finish()
 
     def update(self, dt: float, time: float) -> None:
-        self.update_stage(dt=dt)
+        if self.fight_stage and not self.is_done:
+            self.update_duel_stage()
 
         if self.is_done:
             from game_components.AI.go_and_kiss import GoAndKiss
@@ -180,10 +196,10 @@ class DuelEvent(BaseEvent, EventPredictionMixin):
 
     def draw(self) -> None:
         if FLAG_IMG:
-            MAIN_DISPLAY.blit(FLAG_IMG, self.flag_1_pos)
-            MAIN_DISPLAY.blit(FLAG_IMG, self.flag_2_pos)
+            RENDERER.blit(FLAG_IMG, self.flag_1_pos)
+            RENDERER.blit(FLAG_IMG, self.flag_2_pos)
 
-        MAIN_DISPLAY.blit(self.title_text_surface, self.title_text_surface_pos)
+        RENDERER.blit(self.title_text_surface, self.title_text_surface_pos)
 
         if self.preparing_stage:
             # TODO replace by timer check
@@ -191,30 +207,30 @@ class DuelEvent(BaseEvent, EventPredictionMixin):
                 self.prepare_stage_surface = self.get_preparing_stage_surface()
                 self.prepare_stage_text_render_time = int(self.prepare_timer)
             pos = scaled_w(0.5) - self.prepare_stage_surface.get_width() // 2, self.title_text_surface.get_height()
-            MAIN_DISPLAY.blit(self.prepare_stage_surface, pos)
+            RENDERER.blit(self.prepare_stage_surface, pos)
         else:
             if int(self.duel_timer) != self.fight_stage_text_render_time:
                 self.fight_stage_text_render_time = int(self.duel_timer)
                 self.fight_stage_surface = self.get_duel_stage_surface()
 
             pos = scaled_w(0.5) - self.fight_stage_surface.get_width() // 2, self.title_text_surface.get_height()
-            MAIN_DISPLAY.blit(self.fight_stage_surface, pos)
+            RENDERER.blit(self.fight_stage_surface, pos)
 
     def get_preparing_stage_text(self) -> str:
         return f'Час на ставки: {int(self.prepare_timer)}'
 
     def get_preparing_stage_surface(self) -> Surface:
-        return add_outline_to_image(DEFAULT_FONT.render(self.get_preparing_stage_text(), 1, 'white'))
+        return render_text(self.get_preparing_stage_text())
 
     def get_duel_stage_text(self) -> str:
         return f'{int(self.duel_timer)}'
 
     def get_duel_stage_surface(self) -> Surface:
-        return add_outline_to_image(DEFAULT_FONT.render(self.get_duel_stage_text(), 1, 'white'))
+        return render_text(self.get_duel_stage_text())
 
     def get_title_text_surface(self) -> Surface:
         text = f'{self.duelist_1.name.upper()} vs {self.duelist_2.name.upper()}'
-        return add_outline_to_image(FONT_25_px.render(text, 1, 'white'))
+        return render_text(text, font_=FONT_25_px)
 
     @property
     def duelists_are_on_positions(self) -> bool:
@@ -0,0 +1,52 @@
+from collections import Counter
+from typing import Dict, Set
+
+from game_components.containers import DeferredList
+from game_components.events.base import BaseEvent
+
+__all__ = ['EventRegistry']
+
+
+class EventRegistry(DeferredList):
+    # events list which keeps redeem gating data in step with added and removed events,
+    # so gating queries do not depend on the number of alive events
+    __slots__ = ('registered', 'blocking_count', 'blocked_redeems', 'spawn_listeners')
+
+    def __init__(self):
+        super().__init__()
+        self.registered: Set[BaseEvent] = set()
+        self.blocking_count: int = 0
+        self.blocked_redeems: Counter = Counter()
+        # ordered set of events which have to process new users
+        self.spawn_listeners: Dict[BaseEvent, None] = {}
+
+    def append(self, event: BaseEvent):
+        super().append(event)
+        self.registered.add(event)
+        self.blocking_count += event.is_blocking
+        self.blocked_redeems.update(event.blocked_redeems)
+        if event.process_user_spawn:
+            self.spawn_listeners[event] = None
+
+    def remove(self, event: BaseEvent):
+        if event not in self.registered:
+            return
+        super().remove(event)
+        self.registered.discard(event)
+        self.blocking_count -= event.is_blocking
+        self.blocked_redeems.subtract(event.blocked_redeems)
+        self.spawn_listeners.pop(event, None)
+
+    def clear(self):
+        super().clear()
+        self.registered.clear()
+        self.blocking_count = 0
+        self.blocked_redeems.clear()
+        self.spawn_listeners.clear()
+
+    @property
+    def is_blocking(self) -> bool:
+        return self.blocking_count > 0
+
+    def is_redeem_blocked(self, redeem_name: str) -> bool:
+        return self.blocked_redeems[redeem_name] > 0
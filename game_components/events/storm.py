@@ -1,10 +1,11 @@
 import random
 from typing import Dict
-from pygame import Surface, Rect, draw
+from pygame import Surface, Rect
 
 from game_components.character.user_character import Character
 from game_components.events.base import BaseEvent
 from game_components.screen import MAIN_DISPLAY, is_rect_out_of_screen
+from game_components.render import RENDERER
 from game_components.utils import load_image
 from game_components.constants import CHAR_SIZE
 from game_components.sounds import play_sound
@@ -55,13 +56,13 @@ class StormEvent(BaseEvent):
         return is_rect_out_of_screen(Rect(self.cloud_position, self.cloud_surface.get_size()))
 
     def draw(self) -> None:
-        MAIN_DISPLAY.blit(self.cloud_surface, self.cloud_position)
+        RENDERER.blit(self.cloud_surface, self.cloud_position)
         # draw.rect(MAIN_DISPLAY, [255, 0, 0], self.hit_box)
 
         # TODO lighting image
         if self.target:
             if self.hit_box.left <= self.target.center_x <= self.hit_box.right:
-                draw.line(MAIN_DISPLAY, [255, 255, 255], self.hit_box.center, self.target.center, 3)
+                RENDERER.draw_line([255, 255, 255], self.hit_box.center, self.target.center, 3)
 
     @property
     def cloud_position(self):
@@ -2,7 +2,8 @@ from typing import Optional
 from pygame import Surface, Font
 from game_components.events.base import BaseEvent
 from game_components.utils import get_text_with_outline, DEFAULT_FONT
-from game_components.screen import MAIN_DISPLAY, scaled_w
+from game_components.screen import scaled_w
+from game_components.render import RENDERER
 from game_components.constants import PosType
 
 
@@ -24,15 +25,18 @@ class TitleEvent(BaseEvent):
         self.render_text()
         self.position: PosType = self.get_new_position() if position is None else position
 
-        if event_to_follow is None and timeout is None:
-            self.finish()
+        if event_to_follow is None:
+            if timeout is None:
+                self.finish()
+            else:
+                self.global_data.timers.add_at(self.time, self.finish)
 
     def render_text(self):
         if self.draw_time:
             text = f'{self.str_text} {int(self.time - self.global_data.time)}'
         else:
             text = self.str_text
-        self.text: Surface = get_text_with_outline(text, color=self.text_color)
+        self.text: Surface = get_text_with_outline(text, color=self.text_color, font_=self.font or DEFAULT_FONT)
 
     def change_text(self, text: str, position: PosType = None):
         self.str_text = text
@@ -47,8 +51,6 @@ class TitleEvent(BaseEvent):
             self.render_text()
         if self.event_to_follow:
             self.is_done = self.event_to_follow.is_done
-        elif self.time is not None:
-            self.is_done = self.time < self.global_data.time
 
     def draw(self) -> None:
-        MAIN_DISPLAY.blit(self.text, self.position)
+        RENDERER.blit(self.text, self.position)
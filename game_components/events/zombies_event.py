@@ -1,15 +1,17 @@
-from typing import Dict, Callable
+from typing import Dict, Callable, List
 
 from game_components.events.base import BaseEvent
 from game_components.events.title import TitleEvent
 from game_components.events.prediction_mixin import EventPredictionMixin
-from game_components.screen import scaled_w
-from game_components.constants import KICK_VELOCITY, HOOK_VELOCITY
+from game_components.screen import scaled_w, SCREEN_W
+from game_components.constants import KICK_VELOCITY, HOOK_VELOCITY, FactionsConst
 from game_components.AI.base import AI
 from game_components.AI.defend_from_zombies import DefendFromZombies
 
 from game_components.character.user_character import Character
-from game_components.character.zombie import Zombie, add_zombie
+from game_components.character.zombie import add_zombie
+from game_components.factions import FactionIndex
+from game_components.timers import Timer
 
 from logger import LOGGER
 
@@ -30,28 +32,33 @@ class ZombieEvent(BaseEvent, EventPredictionMixin):
 
     def __init__(self, characters_dict: Dict[str, Character],
                  characters_ai: Dict[str, AI],
+                 factions: FactionIndex,
                  update_prediction: Callable):
         super().__init__(characters_dict=characters_dict, characters_ai=characters_ai)
+        self.factions: FactionIndex = factions
         EventPredictionMixin.__init__(self, update_method=update_prediction)
         self.fight_stage: bool = False
         self.prediction_time = self.global_data.time + self.Const.time_to_predict
         self.time_to_fight = self.prediction_time + self.Const.time_to_fight
-        self.update_method: Callable = self.wait_time
+        self.stage_timers: List[Timer] = [
+            self.global_data.timers.add_at(self.prediction_time, self.start_fight),
+            self.global_data.timers.add_at(self.time_to_fight, self.enable_zombies_destruction),
+        ]
 
     def update(self, dt: float, time: float) -> None:
-        self.update_method()
+        if self.fight_stage:
+            self.fight_time()
 
-    def wait_time(self):
-        if self.global_data.time > self.prediction_time:
+    def start_fight(self):
+        if not self.is_done:
             self.fight_stage = True
-            self.update_method = self.fight_time
             self.lock_prediction()
 
             for ai in self.characters_ai.values():
                 ai.clear()
                 ai.add_task(DefendFromZombies())
 
-            users_number = len(tuple(filter(lambda c: c.is_player, self.characters))) // 2
+            users_number = len(self.factions.members[FactionsConst.Players]) // 2
             if users_number == 0:
                 users_number = 1
 
@@ -71,20 +78,26 @@ class ZombieEvent(BaseEvent, EventPredictionMixin):
                 ai.clear()
                 ai.add_task(DefendFromZombies())
 
+    def enable_zombies_destruction(self):
+        for zombie in self.factions.members[FactionsConst.Zombies]:
+            zombie.enable_destruction()
+
+    def finish(self):
+        super().finish()
+        for timer in self.stage_timers:
+            timer.cancel()
+
     def fight_time(self):
-        any_not_zombie = False
-        any_zombie = False
-        for char in self.characters:
-            if isinstance(char, Zombie):
-                any_zombie = True
-                if self.time_to_fight < self.global_data.time:
-                    char.enable_destruction()
-            else:
-                any_not_zombie = True
+        zombies = self.factions.members[FactionsConst.Zombies]
+        any_zombie = bool(zombies)
+        any_not_zombie = self.factions.has_members(FactionsConst.Players, FactionsConst.Npcs)
 
+        # only characters from buckets near the borders could cross them
+        for char in self.factions.get_in_x_range(-SCREEN_W, LEFT_BORDER):
             if char.x < LEFT_BORDER:
                 char.push(horizontal_velocity=KICK_VELOCITY, vertical_velocity=HOOK_VELOCITY)
-            elif char.rect.right > RIGHT_BORDER:
+        for char in self.factions.get_in_x_range(RIGHT_BORDER - self.global_data.character_width * 2, SCREEN_W):
+            if char.rect.right > RIGHT_BORDER:
                 char.push(horizontal_velocity=-KICK_VELOCITY, vertical_velocity=HOOK_VELOCITY)
 
         if not (any_zombie and any_not_zombie):
@@ -93,16 +106,12 @@ class ZombieEvent(BaseEvent, EventPredictionMixin):
 
             if any_zombie and not any_not_zombie:
                 self.end_prediction(winner=self.Const.Zombie)
-                for char in self.characters:
-                    if isinstance(char, Zombie):
-                        char.enable_destruction()
+                self.enable_zombies_destruction()
 
             elif any_not_zombie and not any_zombie:
                 self.end_prediction(winner=self.Const.Users)
             else:
                 self.cancel_prediction()
-        if self.time_to_fight < self.global_data.time:
-            self.time_to_fight += float('inf')
 
     def draw(self) -> None:
         pass
@@ -0,0 +1,51 @@
+from math import dist, inf
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, Optional, Set
+
+from game_components.constants import FactionsConst, PosType
+from game_components.spatial_index import SpatialIndex
+
+if TYPE_CHECKING:
+    from game_components.character.abc import CharacterABC
+
+__all__ = ['FactionIndex']
+
+
+class FactionIndex:
+    # characters split by faction, every faction has its own membership set and spatial index,
+    # so faction checks do not iterate characters and searches scan only the requested factions
+    def __init__(self):
+        self.members: Dict[str, Set['CharacterABC']] = {faction: set() for faction in FactionsConst.All}
+        self.indexes: Dict[str, SpatialIndex] = {faction: SpatialIndex() for faction in FactionsConst.All}
+        # the widest character ever added, characters overlapping a point are at most this far to the left of it
+        self.max_width: int = 0
+
+    def add(self, character: 'CharacterABC'):
+        self.members[character.faction].add(character)
+        self.indexes[character.faction].add(character)
+        self.max_width = max(self.max_width, character.w_size)
+
+    def remove(self, character: 'CharacterABC'):
+        self.members[character.faction].discard(character)
+        self.indexes[character.faction].remove(character)
+
+    def has_members(self, *factions: str) -> bool:
+        return any(self.members[faction] for faction in factions)
+
+    def find_nearest(self, position: PosType, predicate: Optional[Callable] = None,
+                     factions: Iterable[str] = FactionsConst.All,
+                     exclude: Optional['CharacterABC'] = None) -> Optional['CharacterABC']:
+        nearest, nearest_dist = None, inf
+        for faction in factions:
+            character = self.indexes[faction].find_nearest(position, predicate=predicate, exclude=exclude)
+            if character:
+                character_dist = dist(position, character.position)
+                if character_dist < nearest_dist:
+                    nearest, nearest_dist = character, character_dist
+        return nearest
+
+    def get_in_x_range(self, x_from: float, x_to: float) -> Iterator['CharacterABC']:
+        for index in self.indexes.values():
+            yield from index.get_in_x_range(x_from, x_to)
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self.members.values())
@@ -3,49 +3,71 @@ from typing import Dict, Optional, List, Callable
 
 from logger import LOGGER
 from game_components.AI.base import AI, IdleWalk
+from game_components.AI.scheduler import AIScheduler
+from game_components.AI.perception import PERCEPTION
 from game_components.global_data import GD
 from game_components.character.user_character import Character
 from game_components.character.fabric import get_character
+from game_components.character.zombie import Zombie, ZOMBIE_POOL
 
 from game_components.events.base import BaseEvent
 from game_components.events.storm import StormEvent
 from game_components.events.duel_event import DuelEvent
-from game_components.events.character_died import CharacterGhost
 from game_components.events.zombies_event import ZombieEvent
 from game_components.events.title import TitleEvent
+from game_components.events.registry import EventRegistry
 from game_components.singletone_decorator import single_tone_decorator
 from game_components.save_functions import *
 from game_components.save_functions import add_1_to_user_death_count
 from game_components.sprite_builder import SpritesBuilder
+from game_components.render import RENDERER
+from game_components.particles import PARTICLES, emit_ghost
+from game_components.factions import FactionIndex
+from game_components.physics import PHYSICS_BATCHED, PhysicsStore
+from game_components.rest_tracker import RestTracker
+from game_components.containers import EntityDict
 
 
 @single_tone_decorator
 class Game:
     def __init__(self):
-        self.characters: Dict[str, Character] = {}
+        self.characters: EntityDict = EntityDict()
         self.characters_AI: Dict[str, AI] = {}
-        self.events: List[BaseEvent] = []
+        self.events: EventRegistry = EventRegistry()
+        self.factions: FactionIndex = FactionIndex()
+        self.physics_store: Optional[PhysicsStore] = PhysicsStore() if PHYSICS_BATCHED else None
+        self.rest_tracker: RestTracker = RestTracker()
+        self.ai_scheduler: AIScheduler = AIScheduler()
         self.send_msg: Callable = lambda *_, **__: None  # TODO make functions interfaces
         self.create_prediction: Callable = lambda *_, **__: None
         self.end_prediction: Callable = lambda *_, **__: None
 
     def update(self, dt: float):
-        GD.update_time(dt)
-
-        for event in self.events:
-            if event.behind:
-                event.draw()
+        self.simulate(dt)
+        self.draw()
 
-        for uid, character in self.characters.copy().items():
+    def simulate(self, dt: float):
+        GD.update_time(dt)
+        self.ai_scheduler.next_step()
+        # sleeping characters are settled, so they are skipped until something wakes them up,
+        # batched physics saves previous positions of awake characters itself
+        if self.physics_store is not None:
+            self.physics_store.step(dt)
+        PERCEPTION.update(self.rest_tracker.awake.snapshot(), characters_ai=self.characters_AI, factions=self.factions)
+
+        for uid, character in self.rest_tracker.awake.snapshot():
+            if self.physics_store is None:
+                character.save_previous_position()
             character_ai = self.characters_AI.get(uid)
             if character_ai:
-                character_ai.update(dt=dt, time=GD.time, game_obj=self)
+                self.ai_scheduler.update(character_ai, dt=dt, time=GD.time, game_obj=self)
             try:
                 character.update(dt=dt, time=GD.time)
-                character.draw(dt=dt, time=GD.time)
-                if character.dead:
-                    self.characters.pop(uid)
-                    self.characters_AI.pop(uid, None)
+                if not character.dead:
+                    self.rest_tracker.rest(character, dt=dt,
+                                           settled=character.is_settled and (not character_ai or character_ai.is_idle))
+                else:
+                    self.remove_character(uid)
                     LOGGER.info(f'{character.name} died')
 
                     if character.make_ghost:
@@ -60,25 +82,80 @@ class Game:
             except Exception as e:
                 LOGGER.error(f'Failed to update {uid}\n{e}')
 
-        for event in self.events.copy():
-            event.update(dt, time=GD.time)
+        with self.events.deferred():
+            for event in self.events:
+                event.update(dt, time=GD.time)
+                if event.is_done:
+                    self.events.remove(event)
+                    LOGGER.debug(f'{event.name} is done')
+
+        PARTICLES.update(dt, time=GD.time)
+        ZOMBIE_POOL.recycle()
+
+    def draw(self, alpha: float = 1.):
+        # alpha is a fraction of the simulation step passed since the last simulate call
+        for event in self.events:
+            if event.behind:
+                event.draw()
+        PARTICLES.draw(front=False)
+
+        for uid, character in self.characters.items():
+            try:
+                character.draw(alpha=alpha)
+            except Exception as e:
+                LOGGER.error(f'Failed to draw {uid}\n{e}')
+
+        for event in self.events:
             if not event.behind:
                 event.draw()
-            if event.is_done:
-                self.events.remove(event)
-                LOGGER.debug(f'{event.name} is done')
+        PARTICLES.draw(front=True)
+
+        RENDERER.flush()
+
+    @property
+    def is_idle(self) -> bool:
+        # sleeping characters are settled, so only awake ones could be active
+        return (not self.events and not PARTICLES.count
+                and not any(character.is_active for character in self.rest_tracker.awake.values()))
 
     def get_character(self, name: str) -> Optional[Character]:
         return self.characters.get(name)
 
+    def wake_up_character(self, name: str):
+        if character := self.characters.get(name):
+            character.wake_up()
+
     def add_character(self, name: str, **kwargs):
 
         position = kwargs.pop(Character.attrs_const.position, GD.get_random_spawn_position())
         person_data = get_character_person_attrs(name)
         kwargs.update(person_data)
 
-        self.characters[name] = get_character(name=name, position=position, **kwargs)
-        self.add_ai_for(name, character=self.characters[name])
+        self.add_character_object(name, character=get_character(name=name, position=position, **kwargs))
+
+    def add_character_object(self, uid: str, character: Character, ai: Optional[AI] = None):
+        self.characters[uid] = character
+        self.factions.add(character)
+        self.rest_tracker.add(uid, character)
+        if self.physics_store is not None:
+            self.physics_store.add(character)
+        if ai is None:
+            self.add_ai_for(uid, character=character)
+        else:
+            self.characters_AI[uid] = ai
+
+    def remove_character(self, uid: str) -> Optional[Character]:
+        character = self.characters.pop(uid, None)
+        ai = self.characters_AI.pop(uid, None)
+        if character:
+            self.factions.remove(character)
+            self.rest_tracker.remove(character)
+            PERCEPTION.forget(character)
+            if self.physics_store is not None:
+                self.physics_store.remove(character)
+            if isinstance(character, Zombie):
+                ZOMBIE_POOL.release(uid, zombie=character, ai=ai)
+        return character
 
     def add_ai_for(self, name: str, character: Character = None):
         character = self.characters[name] if character is None else character
@@ -136,8 +213,7 @@ class Game:
                 char_name: str = char_name.strip().lower()
                 try:
                     character: Character = get_character(**char_data)
-                    self.characters[char_name] = character
-                    self.add_ai_for(char_name, character=character)
+                    self.add_character_object(char_name, character=character)
                     if character.move_direction:
                         self.get_character_ai(char_name).add_task(IdleWalk())
                 except Exception as e:
@@ -150,9 +226,8 @@ class Game:
         try:
             ghost_img = SpritesBuilder.get_character_ghost(kind=character.kind,
                                                            size=character.size)
-            self.add_event(CharacterGhost(position=character.position,
-                                          ghost_surface=ghost_img,
-                                          name_surface=character.visual_part.name_surface))
+            emit_ghost(position=character.position, ghost_surface=ghost_img,
+                       name_surface=character.visual_part.name_surface)
         except Exception as e:
             LOGGER.error(f'Failed to create ghost for {character.name}, reason {e}')
 
@@ -160,10 +235,10 @@ class Game:
         self.events.append(event)
 
     def check_if_any_event_is_blocking(self) -> bool:
-        return any([event.is_blocking for event in self.events])
+        return self.events.is_blocking
 
     def check_if_redeem_is_blocked_by_events(self, redeem_name: str) -> bool:
-        return any([redeem_name in event.blocked_redeems for event in self.events])
+        return self.events.is_redeem_blocked(redeem_name)
 
     def start_duel(self, duelist_1: Character, duelist_2: Character):
         self.send_msg(f'УВАГА @{duelist_1.name} оголосив дуель @{duelist_2.name} iamvol3Eh !')
@@ -189,6 +264,7 @@ class Game:
 
         zombie_event = ZombieEvent(characters_dict=self.characters,
                                    characters_ai=self.characters_AI,
+                                   factions=self.factions,
                                    update_prediction=self.end_prediction)
         title = TitleEvent(text='!ZOMBIES ATTACK!', draw_time=True,
                            timeout=ZombieEvent.Const.time_to_predict)
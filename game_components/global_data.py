@@ -5,6 +5,7 @@ from config import Config, BaseConfig
 from game_components.singletone_decorator import single_tone_decorator
 from game_components import constants as const
 from game_components.screen import scaled_w
+from game_components.timers import TimerService
 from logger import LOGGER
 
 
@@ -17,10 +18,13 @@ class GlobalData:
         self.time: float = 0
         self.dt: float = 0
         self.config: BaseConfig = Config()
+        # tasks and events register their deadlines here instead of polling time every tick
+        self.timers: TimerService = TimerService()
 
     def update_time(self, dt: float):
         self.time += dt
         self.dt = dt
+        self.timers.update(self.time)
 
     @staticmethod
     def get_random_spawn_position() -> const.PosType:
@@ -66,6 +70,98 @@ class GlobalData:
     def character_move_speed(self) -> float:
         return self.character_config.get('move_speed', const.MOVE_SPEED)
 
+    @property
+    def render_config(self) -> dict:
+        return self.config.get('render') or {}
+
+    @property
+    def rotation_step(self) -> float:
+        return self.render_config.get('rotation_step', const.ROTATION_STEP)
+
+    @property
+    def rotation_cache_size(self) -> int:
+        return self.render_config.get('rotation_cache_size', const.ROTATION_CACHE_SIZE)
+
+    @property
+    def rotation_cache_memory(self) -> int:
+        return self.render_config.get('rotation_cache_memory', const.ROTATION_CACHE_MEMORY)
+
+    @property
+    def dirty_rects_mode(self) -> bool:
+        return self.render_config.get('dirty_rects', False)
+
+    @property
+    def full_redraw_threshold(self) -> float:
+        return self.render_config.get('full_redraw_threshold', const.FULL_REDRAW_THRESHOLD)
+
+    @property
+    def adaptive_fps(self) -> bool:
+        return self.render_config.get('adaptive_fps', True)
+
+    @property
+    def idle_fps(self) -> int:
+        return self.render_config.get('idle_fps', const.IDLE_FPS)
+
+    @property
+    def idle_delay(self) -> float:
+        return self.render_config.get('idle_delay', const.IDLE_DELAY)
+
+    @property
+    def quality_governor(self) -> bool:
+        return self.render_config.get('quality_governor', True)
+
+    @property
+    def quality_samples(self) -> int:
+        return self.render_config.get('quality_samples', const.QUALITY_SAMPLES)
+
+    @property
+    def quality_degrade_k(self) -> float:
+        return self.render_config.get('quality_degrade_k', const.QUALITY_DEGRADE_K)
+
+    @property
+    def quality_restore_k(self) -> float:
+        return self.render_config.get('quality_restore_k', const.QUALITY_RESTORE_K)
+
+    @property
+    def physics_batched(self) -> bool:
+        return (self.config.get('physics') or {}).get('batched', False)
+
+    @property
+    def simulation_config(self) -> dict:
+        return self.config.get('simulation') or {}
+
+    @property
+    def simulation_step(self) -> float:
+        return self.simulation_config.get('step', const.SIMULATION_STEP)
+
+    @property
+    def max_simulation_steps(self) -> int:
+        return self.simulation_config.get('max_steps', const.MAX_SIMULATION_STEPS)
+
+    @property
+    def max_frame_time(self) -> float:
+        return self.simulation_config.get('max_frame_time', const.MAX_FRAME_TIME)
+
+    @property
+    def ai_background_interval(self) -> int:
+        return max(1, int(self.simulation_config.get('ai_background_interval', const.AI_BACKGROUND_INTERVAL)))
+
+    @property
+    def ai_background_budget(self) -> int:
+        return max(0, int(self.simulation_config.get('ai_background_budget', const.AI_BACKGROUND_BUDGET)))
+
+    @property
+    def rest_delay(self) -> float:
+        return self.simulation_config.get('rest_delay', const.REST_DELAY)
+
+    @property
+    def zombie_pool_size(self) -> int:
+        return max(0, int(self.simulation_config.get('zombie_pool_size', const.ZOMBIE_POOL_SIZE)))
+
+    @property
+    def ai_workers(self) -> int:
+        return max(0, int(self.simulation_config.get('ai_workers', const.AI_WORKERS)))
+
     @property
     def characters_config(self) -> dict:
         c = self.config.raw
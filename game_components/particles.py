@@ -0,0 +1,132 @@
+import os
+import random
+from array import array
+from math import cos
+from typing import List, Optional
+
+from pygame import Surface, transform
+
+from game_components.constants import PosType
+from game_components.quality import QUALITY
+from game_components.render import RENDERER
+from game_components.singletone_decorator import single_tone_decorator
+from game_components.utils import load_image
+
+__all__ = ['ParticleSystem', 'PARTICLES', 'emit_hit', 'emit_heart', 'emit_ghost']
+
+HIT_LIFETIME = 0.3
+HIT_IMAGES: List[Surface] = [load_image(f'hits/{img}', size=(40, 40)) for img in os.listdir('sprites/hits')]
+HIT_IMAGES_FLIPPED: List[Surface] = [transform.flip(img, True, False) for img in HIT_IMAGES]
+HEART_IMAGE: Surface = load_image(path='heart.png')
+FLYING_SPEED = -50
+GHOST_WOBBLE_K = 0.025
+
+
+@single_tone_decorator
+class ParticleSystem:
+    # short living visual effects kept in preallocated arrays, updated in one loop and drawn in one batch,
+    # dead particles are replaced by the last one, so alive particles always take first count slots
+    def __init__(self, capacity: int = 256):
+        self.capacity: int = 0
+        self.count: int = 0
+        self.x: array = array('d')
+        self.y: array = array('d')
+        self.vx: array = array('d')
+        self.vy: array = array('d')
+        self.wobble: array = array('d')  # horizontal swing amplitude, applied every step
+        self.lifetime: array = array('d')
+        self.front: array = array('b')  # drawn over characters
+        self.sprites: List[Optional[Surface]] = []
+        self.labels: List[Optional[Surface]] = []  # drawn above the sprite
+        self.grow(capacity)
+
+    def grow(self, capacity: int):
+        extra = capacity - self.capacity
+        for values in (self.x, self.y, self.vx, self.vy, self.wobble, self.lifetime):
+            values.extend([0.] * extra)
+        self.front.extend([0] * extra)
+        self.sprites.extend([None] * extra)
+        self.labels.extend([None] * extra)
+        self.capacity = capacity
+
+    def emit(self, position: PosType, sprite: Surface, lifetime: float, velocity: PosType = (0, 0),
+             wobble: float = 0, label: Optional[Surface] = None, front: bool = False) -> bool:
+        if lifetime <= 0 or not QUALITY.allow_particle():
+            return False
+        if self.count == self.capacity:
+            self.grow(self.capacity * 2)
+
+        i = self.count
+        self.x[i], self.y[i] = position
+        self.vx[i], self.vy[i] = velocity
+        self.wobble[i] = wobble
+        self.lifetime[i] = lifetime
+        self.front[i] = front
+        self.sprites[i] = sprite
+        self.labels[i] = label
+        self.count += 1
+        return True
+
+    def update(self, dt: float, time: float):
+        swing = cos(time * 2)
+        x, y, vx, vy, wobble, lifetime = self.x, self.y, self.vx, self.vy, self.wobble, self.lifetime
+        i = 0
+        while i < self.count:
+            lifetime[i] -= dt
+            if lifetime[i] < 0:
+                self.kill(i)
+                continue
+            x[i] += vx[i] * dt + wobble[i] * swing
+            y[i] += vy[i] * dt
+            i += 1
+
+    def kill(self, i: int):
+        last = self.count - 1
+        if i != last:
+            for values in (self.x, self.y, self.vx, self.vy, self.wobble, self.lifetime, self.front,
+                           self.sprites, self.labels):
+                values[i] = values[last]
+        self.sprites[last] = self.labels[last] = None
+        self.count = last
+
+    def draw(self, front: bool = False):
+        x, y, sprites, labels = self.x, self.y, self.sprites, self.labels
+        for i in range(self.count):
+            if self.front[i] != front:
+                continue
+            RENDERER.blit(sprites[i], (x[i], y[i]))
+            if labels[i]:
+                RENDERER.blit(labels[i], (x[i], y[i] - labels[i].get_height()))
+
+    def clear(self):
+        for i in range(self.count):
+            self.sprites[i] = self.labels[i] = None
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+
+PARTICLES = ParticleSystem()
+
+
+def get_flying_lifetime(position: PosType, sprite: Surface) -> float:
+    # time until a particle flying up leaves the screen
+    return (position[1] + sprite.get_height()) / -FLYING_SPEED
+
+
+def emit_hit(position: PosType, direction: int = 1):
+    if HIT_IMAGES:
+        image = random.choice(HIT_IMAGES_FLIPPED if direction < 1 else HIT_IMAGES)
+        PARTICLES.emit(position, sprite=image, lifetime=HIT_LIFETIME, front=True)
+
+
+def emit_heart(position: PosType):
+    PARTICLES.emit(position, sprite=HEART_IMAGE, lifetime=get_flying_lifetime(position, HEART_IMAGE),
+                   velocity=(0, FLYING_SPEED))
+
+
+def emit_ghost(position: PosType, ghost_surface: Surface, name_surface: Optional[Surface] = None):
+    PARTICLES.emit(position, sprite=ghost_surface, lifetime=get_flying_lifetime(position, ghost_surface),
+                   velocity=(0, FLYING_SPEED), wobble=ghost_surface.get_width() * GHOST_WOBBLE_K,
+                   label=name_surface)
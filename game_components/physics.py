@@ -0,0 +1,292 @@
+from typing import TYPE_CHECKING, List
+
+from game_components.constants import FALL_SPEED, FALLING_RESIST
+from game_components.global_data import GD
+from game_components.screen import SCREEN_W, SCREEN_H
+from game_components.spatial_index import BUCKET_WIDTH
+from logger import LOGGER
+
+if TYPE_CHECKING:
+    from game_components.character.abc import CharacterABC
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ['PHYSICS_FIELDS', 'PHYSICS_SLOTS', 'PHYSICS_BATCHED', 'PhysicsField', 'PhysicsStore',
+           'install_physics_fields']
+
+PHYSICS_FIELDS = ('position_x', 'position_y', 'horizontal_velocity', 'vertical_velocity',
+                  'rotation_speed', 'angle', 'move_direction', 'look_direction',
+                  'speed', 'movement_time', 'previous_x', 'previous_y')
+
+# preallocated arrays the step writes its intermediate results into
+SCRATCH_ARRAYS = {'ground_y': 'float64', 'rect_x': 'float64', 'rect_y': 'float64', 'values': 'float64',
+                  'falling': 'bool', 'active': 'bool', 'moving': 'bool', 'mask': 'bool', 'moved': 'bool'}
+
+PHYSICS_BATCHED: bool = bool(GD.physics_batched)
+if PHYSICS_BATCHED and np is None:
+    LOGGER.warning('Batched physics requires numpy, falling back to per character physics')
+    PHYSICS_BATCHED = False
+
+# names physics fields take in __slots__ of classes using them
+PHYSICS_SLOTS = tuple(f'_physics_{name}' for name in PHYSICS_FIELDS) if PHYSICS_BATCHED else PHYSICS_FIELDS
+
+
+class PhysicsField:
+    # reads and writes the store row when character is added to the store, own attribute otherwise.
+    # Rows are accessed through memoryviews, which return plain floats without numpy scalar overhead
+    def __init__(self, name: str):
+        self.name: str = name
+        self.private_name: str = f'_physics_{name}'
+
+    def __get__(self, character, owner=None):
+        if character is None:
+            return self
+        store = character.physics_store
+        if store is None:
+            return getattr(character, self.private_name)
+        return store.views[self.name][character.physics_row]
+
+    def __set__(self, character, value):
+        store = character.physics_store
+        if store is None:
+            setattr(character, self.private_name, value)
+        else:
+            row = character.physics_row
+            store.views[self.name][row] = value
+            store.views['settled'][row] = False  # recalculated on the next step
+
+
+def install_physics_fields(cls):
+    for name in PHYSICS_FIELDS:
+        setattr(cls, name, PhysicsField(name))
+    return cls
+
+
+class PhysicsStore:
+    # struct of arrays with physics state of all characters, integrated in one vectorized step
+    def __init__(self, capacity: int = 64):
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.arrays: dict = {name: np.zeros(capacity, dtype=np.float64) for name in PHYSICS_FIELDS}
+        # sizes are not changed by physics, so they are copied and not shared with characters
+        self.arrays['w_size'] = np.zeros(capacity, dtype=np.float64)
+        self.arrays['h_size'] = np.zeros(capacity, dtype=np.float64)
+        # sleeping rows are not integrated, settled rows are not moving and are on the ground
+        self.arrays['awake'] = np.zeros(capacity, dtype=bool)
+        self.arrays['settled'] = np.zeros(capacity, dtype=bool)
+        self.scratch: dict = {name: np.zeros(capacity, dtype=dtype) for name, dtype in SCRATCH_ARRAYS.items()}
+        self.views: dict = {}
+        self.update_views()
+        self.characters: List['CharacterABC'] = []
+
+    def update_views(self):
+        self.views = {name: memoryview(array)
+                      for arrays in (self.arrays, self.scratch) for name, array in arrays.items()}
+
+    def add(self, character: 'CharacterABC'):
+        if self.count == self.capacity:
+            self.grow()
+
+        values = {name: getattr(character, name) for name in PHYSICS_FIELDS}
+        row = self.count
+        for name, value in values.items():
+            self.arrays[name][row] = value
+        self.arrays['w_size'][row] = character.w_size
+        self.arrays['h_size'][row] = character.h_size
+        self.arrays['awake'][row] = True
+        self.arrays['settled'][row] = False
+        self.characters.append(character)
+        self.count += 1
+
+        character.physics_row = row
+        character.physics_store = self
+
+    def remove(self, character: 'CharacterABC'):
+        if character.physics_store is not self:
+            return
+
+        values = {name: getattr(character, name) for name in PHYSICS_FIELDS}
+        row, last = character.physics_row, self.count - 1
+        if row != last:
+            moved = self.characters[last]
+            for array in self.arrays.values():
+                array[row] = array[last]
+            self.characters[row] = moved
+            moved.physics_row = row
+        self.arrays['awake'][last] = False  # rows above count are not integrated
+        self.characters.pop()
+        self.count -= 1
+
+        character.physics_store = None
+        character.physics_row = None
+        for name, value in values.items():
+            setattr(character, name, value)
+
+    def grow(self):
+        self.capacity *= 2
+        for name, array in self.arrays.items():
+            new_array = np.zeros(self.capacity, dtype=array.dtype)
+            new_array[:self.count] = array[:self.count]
+            self.arrays[name] = new_array
+        self.scratch = {name: np.zeros(self.capacity, dtype=dtype) for name, dtype in SCRATCH_ARRAYS.items()}
+        self.update_views()
+
+    def set_awake(self, character: 'CharacterABC', awake: bool):
+        if character.physics_store is self:
+            self.views['awake'][character.physics_row] = awake
+
+    def is_settled(self, character: 'CharacterABC') -> bool:
+        return self.views['settled'][character.physics_row]
+
+    def step(self, dt: float, screen_w: int = SCREEN_W, screen_h: int = SCREEN_H):
+        # integrates awake rows, then writes rects and spatial buckets only of characters which moved.
+        # Whole arrays are computed into preallocated scratch arrays and copied to masked rows, rows above
+        # count are never awake. Ufuncs with where= and reductions like any() allocate buffers, so are not used
+        if not self.count:
+            return
+
+        a, s = self.arrays, self.scratch
+        x, y = a['position_x'], a['position_y']
+        vx, vy = a['horizontal_velocity'], a['vertical_velocity']
+        md, w, h = a['move_direction'], a['w_size'], a['h_size']
+        previous_x, previous_y = a['previous_x'], a['previous_y']
+        awake = a['awake']
+        ground_y, rect_x, rect_y, values = s['ground_y'], s['rect_x'], s['rect_y'], s['values']
+        falling, active, moving, mask = s['falling'], s['active'], s['moving'], s['mask']
+
+        np.subtract(screen_h, h, out=ground_y)
+        # rects are always truncated positions
+        np.trunc(x, out=values)
+        np.copyto(previous_x, values, where=awake)
+        np.trunc(y, out=values)
+        np.copyto(previous_y, values, where=awake)
+
+        # fall
+        np.subtract(ground_y, 1, out=values)
+        np.less(previous_y, values, out=falling)
+        np.not_equal(vy, 0, out=active)
+        np.logical_or(active, falling, out=active)
+        np.logical_and(active, awake, out=active)
+        np.multiply(vy, dt, out=values)
+        np.add(y, values, out=values)
+        np.copyto(y, values, where=active)
+        np.add(vy, FALL_SPEED * dt, out=values)
+        np.copyto(vy, values, where=active)
+        np.trunc(y, out=rect_y)
+        np.multiply(h, -2, out=values)
+        np.less(rect_y, values, out=mask)
+        np.logical_and(mask, active, out=mask)
+        np.copyto(y, values, where=mask)
+        np.copyto(vy, 0, where=mask)
+        np.greater(rect_y, ground_y, out=mask)
+        np.logical_and(mask, active, out=mask)
+        np.copyto(y, ground_y, where=mask)
+        np.copyto(vy, 0, where=mask)
+
+        # move
+        np.trunc(y, out=rect_y)
+        np.subtract(ground_y, 1, out=values)
+        np.less(rect_y, values, out=falling)
+        np.not_equal(md, 0, out=moving)
+        np.not_equal(vx, 0, out=mask)
+        np.logical_or(moving, mask, out=moving)
+        np.logical_and(moving, awake, out=moving)
+        # in air
+        np.logical_and(mask, moving, out=mask)
+        np.logical_and(mask, falling, out=mask)
+        np.multiply(vx, FALLING_RESIST * dt, out=values)
+        np.subtract(vx, values, out=values)
+        np.round(values, 2, out=values)
+        np.copyto(vx, values, where=mask)
+        # on ground
+        np.logical_not(falling, out=mask)
+        np.logical_and(mask, moving, out=mask)
+        np.multiply(md, a['speed'], out=values)
+        np.copyto(vx, values, where=mask)
+        np.add(a['movement_time'], dt, out=values)
+        np.copyto(a['movement_time'], values, where=mask)
+        np.multiply(vx, dt, out=values)
+        np.add(x, values, out=values)
+        np.copyto(x, values, where=moving)
+        np.not_equal(vx, 0, out=mask)
+        np.logical_and(mask, moving, out=mask)
+        np.sign(vx, out=values)
+        np.copyto(a['look_direction'], values, where=mask)
+
+        np.trunc(x, out=rect_x)
+        np.subtract(screen_w, w, out=values)
+        np.greater(rect_x, values, out=mask)
+        np.logical_and(mask, moving, out=mask)
+        np.copyto(x, values, where=mask)
+        np.copyto(md, -1, where=mask)
+        np.less(rect_x, 1, out=mask)
+        np.logical_and(mask, moving, out=mask)
+        np.copyto(x, 0, where=mask)
+        np.copyto(md, 1, where=mask)
+
+        # rotation
+        angle, rotation_speed = a['angle'], a['rotation_speed']
+        np.logical_not(falling, out=mask)
+        np.logical_and(mask, awake, out=mask)
+        np.copyto(angle, 0, where=mask)
+        np.copyto(rotation_speed, 0, where=mask)
+        np.logical_and(falling, awake, out=mask)
+        np.add(angle, rotation_speed, out=values)
+        np.copyto(angle, values, where=mask)
+
+        settled = a['settled']
+        np.logical_not(falling, out=settled)
+        for array in (md, vx, vy, rotation_speed):
+            np.equal(array, 0, out=mask)
+            np.logical_and(settled, mask, out=settled)
+
+        np.trunc(x, out=rect_x)
+        np.trunc(y, out=rect_y)
+        moved = s['moved']
+        np.not_equal(rect_x, previous_x, out=moved)
+        np.not_equal(rect_y, previous_y, out=mask)
+        np.logical_or(moved, mask, out=moved)
+        np.logical_and(moved, awake, out=moved)
+        if not np.count_nonzero(moved):
+            return
+
+        views, characters = self.views, self.characters
+        moved, rect_x, rect_y, previous_x = views['moved'], views['rect_x'], views['rect_y'], views['previous_x']
+        for row in range(self.count):
+            if not moved[row]:
+                continue
+            character = characters[row]
+            x_pos = rect_x[row]
+            character.rect.topleft = x_pos, rect_y[row]
+            if x_pos // BUCKET_WIDTH != previous_x[row] // BUCKET_WIDTH and character.spatial_index:
+                character.spatial_index.update(character)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+if __name__ == '__main__':
+    import random
+    from time import perf_counter
+    from game_components.game import Game
+
+    # compare by running with physics.batched switched on and off in the config
+    steps = 200
+    game = Game()
+    for count in (1000, 3000):
+        for i in range(len(game.characters), count):
+            game.add_character(f'character {i}')
+            game.characters[f'character {i}'].position = (random.uniform(0, SCREEN_W), random.uniform(0, SCREEN_H))
+            game.get_character_ai(f'character {i}').run_idle_walking()
+        for _ in range(30):
+            game.simulate(1 / 60)
+
+        start = perf_counter()
+        for _ in range(steps):
+            game.simulate(1 / 60)
+        spent = (perf_counter() - start) / steps
+        print(f'{"batched" if PHYSICS_BATCHED else "per character"} physics, {count} idle walkers: '
+              f'{spent * 1000:.2f} ms per simulation step')
@@ -0,0 +1,70 @@
+import enum
+from collections import deque
+from typing import Deque
+
+from game_components.global_data import GD
+from game_components.singletone_decorator import single_tone_decorator
+from logger import LOGGER
+
+__all__ = ['QualityLevel', 'QualityGovernor', 'QUALITY']
+
+
+class QualityLevel(enum.IntEnum):
+    Full = 0
+    NoClothesRotation = 1  # flying characters are rotated without clothes
+    NoNpcLabels = 2
+    FewerParticles = 3
+    LowRotationResolution = 4
+
+
+@single_tone_decorator
+class QualityGovernor:
+    # lowers quality level when average frame work time goes over the budget and restores it when load drops,
+    # hysteresis comes from different degrade/restore thresholds and from refilling samples after every change
+    def __init__(self):
+        self.enabled: bool = GD.quality_governor
+        self.level: QualityLevel = QualityLevel.Full
+        self.frame_times: Deque[float] = deque(maxlen=GD.quality_samples)
+        self.particles_counter: int = 0
+
+    def add_frame_time(self, frame_time: float, budget: float):
+        if not self.enabled:
+            return
+
+        self.frame_times.append(frame_time)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        average = sum(self.frame_times) / len(self.frame_times)
+        if average > budget * GD.quality_degrade_k and self.level < max(QualityLevel):
+            self.set_level(QualityLevel(self.level + 1))
+        elif average < budget * GD.quality_restore_k and self.level > QualityLevel.Full:
+            self.set_level(QualityLevel(self.level - 1))
+
+    def set_level(self, level: QualityLevel):
+        LOGGER.info(f'Quality level changed from {self.level.name} to {level.name}')
+        self.level = level
+        self.frame_times.clear()
+
+    def allow_particle(self) -> bool:
+        if self.level < QualityLevel.FewerParticles:
+            return True
+        self.particles_counter += 1
+        return self.particles_counter % 2 == 0
+
+    @property
+    def rotate_clothes(self) -> bool:
+        return self.level < QualityLevel.NoClothesRotation
+
+    @property
+    def draw_npc_labels(self) -> bool:
+        return self.level < QualityLevel.NoNpcLabels
+
+    @property
+    def rotation_step(self) -> float:
+        if self.level >= QualityLevel.LowRotationResolution:
+            return GD.rotation_step * 3
+        return GD.rotation_step
+
+
+QUALITY = QualityGovernor()
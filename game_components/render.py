@@ -0,0 +1,68 @@
+from typing import List, Tuple
+from pygame import Rect, Surface, display, draw
+
+from game_components.constants import PosType
+from game_components.global_data import GD
+from game_components.screen import MAIN_DISPLAY, MAIN_SCREEN_DEF_COLOR
+from game_components.singletone_decorator import single_tone_decorator
+
+__all__ = ['Renderer', 'RENDERER']
+
+
+@single_tone_decorator
+class Renderer:
+    # all drawing on the MAIN_DISPLAY goes through the renderer, so it knows which parts of the screen were touched.
+    # Blits are collected into the draw list and submitted in one batch, list order keeps the layering
+    def __init__(self):
+        self.dirty_rects_mode: bool = GD.dirty_rects_mode
+        self.full_redraw_threshold: float = GD.full_redraw_threshold
+        self.screen_area: int = MAIN_DISPLAY.get_width() * MAIN_DISPLAY.get_height()
+        self.dirty_rects: List[Rect] = []
+        self.previous_dirty_rects: List[Rect] = []
+        self.draw_list: List[Tuple[Surface, PosType]] = []
+
+    def blit(self, surface: Surface, position: PosType):
+        self.draw_list.append((surface, tuple(position)))
+
+    def flush(self):
+        if not self.draw_list:
+            return
+
+        if self.dirty_rects_mode:
+            self.dirty_rects.extend(MAIN_DISPLAY.blits(self.draw_list, doreturn=1))
+        else:
+            MAIN_DISPLAY.fblits(self.draw_list)
+        self.draw_list.clear()
+
+    def draw_line(self, color, start_pos: PosType, end_pos: PosType, width: int = 1) -> Rect:
+        self.flush()
+        rect = draw.line(MAIN_DISPLAY, color, start_pos, end_pos, width)
+        self.dirty_rects.append(rect)
+        return rect
+
+    def begin_frame(self):
+        if self.full_redraw_required(self.previous_dirty_rects):
+            MAIN_DISPLAY.fill(MAIN_SCREEN_DEF_COLOR)
+        else:
+            for rect in self.previous_dirty_rects:
+                MAIN_DISPLAY.fill(MAIN_SCREEN_DEF_COLOR, rect)
+
+    def end_frame(self):
+        self.flush()
+        # previous rects are updated too, to show erased places
+        rects = self.previous_dirty_rects + self.dirty_rects
+        if self.full_redraw_required(rects):
+            display.update()
+        else:
+            display.update(rects)
+
+        self.previous_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+
+    def full_redraw_required(self, rects: List[Rect]) -> bool:
+        if not self.dirty_rects_mode:
+            return True
+        return sum(r.w * r.h for r in rects) > self.screen_area * self.full_redraw_threshold
+
+
+RENDERER = Renderer()
@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING, Dict
+
+from game_components.global_data import GD
+from game_components.containers import EntityDict
+
+if TYPE_CHECKING:
+    from game_components.character.abc import CharacterABC
+
+__all__ = ['RestTracker']
+
+
+class RestTracker:
+    # characters settled for rest_delay are taken out of the update set until something wakes them up
+    def __init__(self, rest_delay: float = None):
+        self.rest_delay: float = GD.rest_delay if rest_delay is None else rest_delay
+        self.awake: EntityDict = EntityDict()
+        self.sleeping: Dict[str, 'CharacterABC'] = {}
+        self.uids: Dict['CharacterABC', str] = {}
+
+    def add(self, uid: str, character: 'CharacterABC'):
+        self.uids[character] = uid
+        self.awake[uid] = character
+        character.rest_time = 0
+        character.rest_tracker = self
+
+    def remove(self, character: 'CharacterABC'):
+        uid = self.uids.pop(character, None)
+        if uid is not None:
+            self.awake.pop(uid, None)
+            self.sleeping.pop(uid, None)
+        character.rest_tracker = None
+
+    def wake_up(self, character: 'CharacterABC'):
+        character.rest_time = 0
+        uid = self.uids.get(character)
+        if uid in self.sleeping:
+            self.awake[uid] = self.sleeping.pop(uid)
+            self.set_awake(character, True)
+
+    def rest(self, character: 'CharacterABC', dt: float, settled: bool):
+        if not settled:
+            character.rest_time = 0
+            return
+
+        character.rest_time += dt
+        if character.rest_time >= self.rest_delay:
+            uid = self.uids.get(character)
+            if uid in self.awake:
+                self.sleeping[uid] = self.awake.pop(uid)
+                self.set_awake(character, False)
+
+    @staticmethod
+    def set_awake(character: 'CharacterABC', awake: bool):
+        # sleeping rows are skipped by batched physics
+        if character.physics_store is not None:
+            character.physics_store.set_awake(character, awake)
+
+    def is_sleeping(self, character: 'CharacterABC') -> bool:
+        return self.uids.get(character) in self.sleeping
+
+    def __len__(self) -> int:
+        return len(self.uids)
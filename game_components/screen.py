@@ -1,10 +1,61 @@
+import os
+import sys
 from pygame import display, Surface, SRCALPHA, DOUBLEBUF, HWACCEL, FULLSCREEN, SCALED, OPENGL, HWSURFACE, RESIZABLE
 from pygame import Rect
-import ctypes
+from config import Config, CONFIG_PATH
 
-user32 = ctypes.windll.user32
-SCREEN_W, SCREEN_H = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
-SCREEN_H = SCREEN_H // 4
+HEADLESS_ENV = 'HEADLESS'
+RESOLUTION_ENV = 'SCREEN_RESOLUTION'  # e.g. 1920x270
+HEADLESS_VIDEO_DRIVER = 'dummy'
+DEFAULT_HEADLESS_RESOLUTION = 1920, 1080 // 4
+
+
+def get_screen_config() -> dict:
+    if not os.path.exists(CONFIG_PATH):
+        return {}
+    return Config().get('screen') or {}
+
+
+def is_headless() -> bool:
+    env_value = os.getenv(HEADLESS_ENV, '')
+    if env_value:
+        return env_value.lower() not in ('0', 'false', 'no', 'off')
+    return bool(get_screen_config().get('headless', False))
+
+
+def get_configured_resolution():
+    env_value = os.getenv(RESOLUTION_ENV)
+    if env_value:
+        w, h = env_value.lower().split('x')
+        return int(w), int(h)
+
+    resolution = get_screen_config().get('resolution')
+    return (int(resolution[0]), int(resolution[1])) if resolution else None
+
+
+HEADLESS: bool = is_headless()
+
+if HEADLESS:
+    os.environ['SDL_VIDEODRIVER'] = HEADLESS_VIDEO_DRIVER
+    os.environ.setdefault('SDL_AUDIODRIVER', HEADLESS_VIDEO_DRIVER)
+    if display.get_init() and display.get_driver() != HEADLESS_VIDEO_DRIVER:
+        display.quit()
+    display.init()
+    SCREEN_W, SCREEN_H = get_configured_resolution() or DEFAULT_HEADLESS_RESOLUTION
+
+elif resolution := get_configured_resolution():
+    SCREEN_W, SCREEN_H = resolution
+
+else:
+    if sys.platform == 'win32':
+        import ctypes
+
+        user32 = ctypes.windll.user32
+        SCREEN_W, SCREEN_H = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+    else:
+        display.init()
+        SCREEN_W, SCREEN_H = display.get_desktop_sizes()[0]
+    SCREEN_H = SCREEN_H // 4
 
 
 def scaled_w(k) -> int:
@@ -3,13 +3,16 @@ from pygame import mixer
 from logger import LOGGER
 from game_components.constants import KICK_SOUND, KISS_SOUND
 from config import Config
-mixer.Channel(0).set_volume(0.3)
+if mixer.get_init():
+    mixer.Channel(0).set_volume(0.3)
 
 SOUNDS_CACHE = {}
 CONFIG = Config()
 
 
 def play_sound(sound_path: str):
+    if not mixer.get_init():  # e.g. headless mode without audio device
+        return
     sound_path = Path(sound_path)
     if not str(sound_path).startswith('sounds'):
         sound_path = Path('sounds', sound_path)
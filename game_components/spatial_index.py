@@ -0,0 +1,83 @@
+from collections import defaultdict
+from math import dist, inf
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Set
+
+from game_components.constants import CHAR_SIZE, PosType
+
+if TYPE_CHECKING:
+    from game_components.character.abc import CharacterABC
+
+__all__ = ['SpatialIndex', 'BUCKET_WIDTH']
+
+BUCKET_WIDTH = CHAR_SIZE * 2
+
+
+class SpatialIndex:
+    # characters are bucketed by x coordinate, because they mostly live on the ground line
+    def __init__(self, bucket_width: int = BUCKET_WIDTH):
+        self.bucket_width: int = bucket_width
+        self.buckets: Dict[int, Set['CharacterABC']] = defaultdict(set)
+        self.characters_buckets: Dict['CharacterABC', int] = {}
+
+    def get_bucket(self, x: float) -> int:
+        return int(x // self.bucket_width)
+
+    def add(self, character: 'CharacterABC'):
+        bucket = self.get_bucket(character.rect.x)
+        self.buckets[bucket].add(character)
+        self.characters_buckets[character] = bucket
+        character.spatial_index = self
+
+    def remove(self, character: 'CharacterABC'):
+        bucket = self.characters_buckets.pop(character, None)
+        if bucket is not None:
+            self.discard_from_bucket(character, bucket)
+        character.spatial_index = None
+
+    def update(self, character: 'CharacterABC'):
+        bucket = self.get_bucket(character.rect.x)
+        old_bucket = self.characters_buckets[character]
+        if bucket != old_bucket:
+            self.discard_from_bucket(character, old_bucket)
+            self.buckets[bucket].add(character)
+            self.characters_buckets[character] = bucket
+
+    def discard_from_bucket(self, character: 'CharacterABC', bucket: int):
+        characters = self.buckets[bucket]
+        characters.discard(character)
+        if not characters:
+            del self.buckets[bucket]
+
+    def find_nearest(self, position: PosType, predicate: Optional[Callable] = None,
+                     exclude: Optional['CharacterABC'] = None) -> Optional['CharacterABC']:
+        if not self.buckets:
+            return None
+
+        center_bucket = self.get_bucket(position[0])
+        max_ring = max(center_bucket - min(self.buckets), max(self.buckets) - center_bucket)
+        nearest, nearest_dist = None, inf
+        for ring in range(max_ring + 1):
+            # closest possible x distance to characters in this ring
+            if (ring - 1) * self.bucket_width > nearest_dist:
+                break
+
+            for bucket in {center_bucket - ring, center_bucket + ring}:
+                for character in self.buckets.get(bucket, ()):
+                    if character is exclude:
+                        continue
+                    if predicate is None or predicate(character):
+                        character_dist = dist(position, character.position)
+                        if character_dist < nearest_dist:
+                            nearest, nearest_dist = character, character_dist
+
+        return nearest
+
+    def get_in_x_range(self, x_from: float, x_to: float) -> Iterator['CharacterABC']:
+        # characters of buckets overlapping the range, exact positions are checked by the caller
+        first, last = self.get_bucket(x_from), self.get_bucket(x_to)
+        for bucket, characters in self.buckets.items():
+            if first <= bucket <= last:
+                yield from characters
+
+    def __len__(self) -> int:
+        return len(self.characters_buckets)
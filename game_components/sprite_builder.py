@@ -1,16 +1,25 @@
 from pathlib import Path
-from pygame import Surface, Color
+from typing import Optional, Tuple
+from pygame import Surface, Color, Mask, mask as py_mask, transform
 
+from game_components.cache import LRUCache
+from game_components.global_data import GD
 from game_components.utils import load_image, normalize_color
-from game_components.constants import SizeType
+from game_components.constants import SizeType, ROTATION_STEP
 
 BODY_IMG_NAME: str = 'sprite.png'
 MASK_IMG_NAME: str = 'mask.png'
 GHOST_IMG_NAME: str = 'ghost.png'
+RECOLORED_CACHE_SIZE: int = 256
 
 
 class SpritesBuilder:
     CACHE = {}
+    MASKS_CACHE = {}
+    RECOLORED_CACHE: LRUCache = LRUCache(max_size=RECOLORED_CACHE_SIZE)
+    ROTATED_CACHE: LRUCache = LRUCache(max_size=GD.rotation_cache_size,
+                                       max_memory=GD.rotation_cache_memory,
+                                       get_item_memory=lambda s: s.get_width() * s.get_height() * s.get_bytesize())
 
     class RecolorKeys:
         BODY_COLOR_KEY: Color = Color('blue')
@@ -29,12 +38,77 @@ class SpritesBuilder:
     def get_character_ghost(cls, kind: str, size=None, smooth_scale=False) -> Surface:
         return cls.load_image_cache(path=Path(kind, GHOST_IMG_NAME), size=size, smooth_scale=smooth_scale)
 
+    @classmethod
+    def get_recolored_body(cls, kind: str, state: str, size: SizeType,
+                           body_color: Optional[Color] = None,
+                           eyes_color: Optional[Color] = None) -> Tuple[Surface, Surface]:
+        # returns recolored body and its mirror, surfaces are shared between characters so must not be changed
+        key = (kind, state, tuple(size),
+               tuple(Color(body_color)) if body_color else None,
+               tuple(Color(eyes_color)) if eyes_color else None)
+        surfaces = cls.RECOLORED_CACHE.get(key)
+        if surfaces is None:
+            surface = cls.get_character_body_img(kind=kind, size=size, state=state)
+            if body_color:
+                surface = cls.recolor_surface(surface=surface, kind=kind, state=state,
+                                              color_key=cls.RecolorKeys.BODY_COLOR_KEY,
+                                              new_color=body_color)
+            if eyes_color:
+                surface = cls.recolor_surface(surface=surface, kind=kind, state=state,
+                                              color_key=cls.RecolorKeys.EYES_COLOR_KEY,
+                                              new_color=eyes_color)
+            surfaces = cls.RECOLORED_CACHE.put(key, (surface, transform.flip(surface, flip_x=True, flip_y=False)))
+
+        return surfaces
+
+    @classmethod
+    def get_rotated_surface(cls, surface: Surface, angle: float, step: float = ROTATION_STEP) -> Surface:
+        # angle is snapped to the step, so rotated surfaces could be reused between frames
+        angle = (round(angle / step) * step if step else angle) % 360
+        if not angle:
+            return surface
+
+        key = surface, angle
+        rotated = cls.ROTATED_CACHE.get(key)
+        if rotated is None:
+            rotated = cls.ROTATED_CACHE.put(key, transform.rotate(surface, angle))
+        return rotated
+
+    @classmethod
+    def get_recolor_key_mask(cls, kind: str, state: str, color_key: Color,
+                             size: SizeType, mask_name: str = MASK_IMG_NAME) -> Mask:
+        color_key = Color(color_key)
+        key = kind, state, tuple(size), mask_name, tuple(color_key)
+        if key not in cls.MASKS_CACHE:
+            mask_surface = cls.get_character_mask(kind=kind, state=state, mask_name=mask_name, size=size)
+            # from_threshold ignores alpha, so pixels are additionally matched by the key alpha value
+            key_mask = py_mask.from_threshold(mask_surface, color_key, (1, 1, 1, 255))
+            if color_key.a:
+                key_mask = key_mask.overlap_mask(py_mask.from_surface(mask_surface, threshold=color_key.a - 1), (0, 0))
+            if color_key.a < 255:
+                key_mask.erase(py_mask.from_surface(mask_surface, threshold=color_key.a), (0, 0))
+            cls.MASKS_CACHE[key] = key_mask
+        return cls.MASKS_CACHE[key]
+
     @classmethod
     def recolor_surface(cls, surface: Surface, color_key: Color,
                         new_color: Color, kind: str,
                         state: str, mask_name: str = MASK_IMG_NAME) -> Surface:
         new_color = normalize_color(new_color)
         surface = surface.copy()
+        key_mask = cls.get_recolor_key_mask(kind=kind, state=state, color_key=color_key,
+                                            size=surface.get_size(), mask_name=mask_name)
+        key_mask.to_surface(surface, setcolor=new_color, unsetcolor=None)
+
+        return surface
+
+    # reference per pixel implementation of recolor_surface, kept for the frame time comparison below
+    @classmethod
+    def recolor_surface_per_pixel(cls, surface: Surface, color_key: Color,
+                                  new_color: Color, kind: str,
+                                  state: str, mask_name: str = MASK_IMG_NAME) -> Surface:
+        new_color = normalize_color(new_color)
+        surface = surface.copy()
         w, h = surface.get_size()
         mask_surface = cls.get_character_mask(kind=kind, state=state, mask_name=mask_name, size=surface.get_size())
         for x in range(w):
@@ -56,3 +130,14 @@ class SpritesBuilder:
     @classmethod
     def get_clothe_surface(cls, name: str, size: SizeType = None) -> Surface:
         return cls.load_image_cache(path=Path('clothes', name), size=size)
+
+
+if __name__ == '__main__':
+    from timeit import timeit
+
+    body = SpritesBuilder.get_character_body_img(kind='cat', state='idle', size=(80, 80))
+    for func in (SpritesBuilder.recolor_surface_per_pixel, SpritesBuilder.recolor_surface):
+        spent = timeit(lambda: func(surface=body, kind='cat', state='idle',
+                                    color_key=SpritesBuilder.RecolorKeys.BODY_COLOR_KEY,
+                                    new_color=Color('red')), number=100)
+        print(f'{func.__name__}: {spent * 10:.3f} ms per recolor')
@@ -0,0 +1,65 @@
+from heapq import heappop, heappush
+from itertools import count
+from typing import Callable, List, Optional, Tuple
+
+from logger import LOGGER
+
+__all__ = ['Timer', 'TimerService']
+
+
+class Timer:
+    __slots__ = ('deadline', 'callback', 'cancelled', 'fired')
+
+    def __init__(self, deadline: float, callback: Callable):
+        self.deadline: float = deadline
+        self.callback: Optional[Callable] = callback
+        self.cancelled: bool = False
+        self.fired: bool = False
+
+    def cancel(self):
+        self.cancelled = True
+        self.callback = None
+
+    @property
+    def is_active(self) -> bool:
+        return not (self.cancelled or self.fired)
+
+
+class TimerService:
+    # deadlines are kept in a heap, timers which deadline has passed are fired on time update in deadline order,
+    # timers with the same deadline in registration order. Cancelled timers are dropped when they reach the top
+    def __init__(self):
+        self.time: float = 0
+        self.heap: List[Tuple[float, int, Timer]] = []
+        self.counter = count()
+
+    def add(self, delay: float, callback: Callable) -> Timer:
+        return self.add_at(self.time + delay, callback)
+
+    def add_at(self, deadline: float, callback: Callable) -> Timer:
+        timer = Timer(deadline, callback)
+        heappush(self.heap, (deadline, next(self.counter), timer))
+        return timer
+
+    def update(self, time: float):
+        self.time = time
+        heap = self.heap
+        while heap and heap[0][0] < time:
+            timer = heappop(heap)[2]
+            if timer.cancelled:
+                continue
+
+            callback, timer.callback = timer.callback, None
+            timer.fired = True
+            try:
+                callback()
+            except Exception as e:
+                LOGGER.error(f'Timer callback {callback} failed\n{e}')
+
+    def clear(self):
+        for *_, timer in self.heap:
+            timer.cancel()
+        self.heap.clear()
+
+    def __len__(self) -> int:
+        return len(self.heap)
@@ -3,8 +3,11 @@ from pathlib import Path
 from pygame import Surface, SRCALPHA, font, mask as py_mask
 from pygame import image, error, transform, Color, surface, draw
 from logger import LOGGER
+from game_components.cache import LRUCache
 from game_components.screen import scaled_w
 
+TEXT_CACHE_SIZE: int = 512
+
 
 def get_surface(h_size, v_size=None, transparent: (bool, int) = 0, flags=0, color=None):
     v_size = v_size if v_size else h_size
@@ -21,11 +24,14 @@ def get_surface(h_size, v_size=None, transparent: (bool, int) = 0, flags=0, colo
     return surf
 
 
+font.init()  # no-op when pygame is already initialized, lets modules run standalone
 DEFAULT_FONT = font.SysFont('Arial', scaled_w(0.01))
 DEFAULT_BACK_FONT = font.SysFont('Arial', scaled_w(0.015), bold=True, italic=True)
 FONT_25_px = font.SysFont('Arial', 25, bold=True, italic=True)
 FONT_35_px = font.SysFont('Arial', 35, bold=True, italic=True)
 
+TEXT_CACHE: LRUCache = LRUCache(max_size=TEXT_CACHE_SIZE)
+
 
 def load_image(path: Union[str, Path], size: (int, int) = None, smooth_scale=False) -> surface.Surface:
     try:
@@ -75,9 +81,25 @@ def add_outline_to_image(image: Surface, border_color: tuple = (0, 0, 0)) -> Sur
     return result_surface
 
 
+def render_text(text: str, font_: font.Font = DEFAULT_FONT, color='white', antialias: bool = True,
+                background=None, outline: bool = True, border_color: tuple = (0, 0, 0)) -> Surface:
+    # returned surfaces are shared through the cache, so they must not be changed
+    key = (text, font_, tuple(Color(color)), bool(antialias),
+           tuple(Color(background)) if background else None,
+           tuple(Color(border_color)) if outline else None)
+    text_surface = TEXT_CACHE.get(key)
+    if text_surface is None:
+        text_surface = font_.render(text, antialias, color, background)
+        if outline:
+            text_surface = add_outline_to_image(text_surface, border_color=border_color)
+        TEXT_CACHE.put(key, text_surface)
+
+    return text_surface
+
+
 def get_text_with_outline(text: str, color='white', font_: font.Font = DEFAULT_FONT,
                           border_color: tuple = (0, 0, 0)) -> Surface:
-    return add_outline_to_image(font_.render(text, 0, color), border_color=border_color)
+    return render_text(text, font_=font_, color=color, antialias=False, border_color=border_color)
 
 
 def get_progress_bar(current: int, max_value: int, h_size: int, v_size: int,
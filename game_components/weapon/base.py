@@ -3,6 +3,8 @@ from game_components.constants import PosType
 
 
 class BaseWeapon:
+    __slots__ = ('cooldown', 'cooldown_time', 'position')
+
     def __init__(self, position: PosType, cooldown: float = 0.5, cooldown_time: float = 0):
         self.cooldown: float = cooldown
         self.cooldown_time: float = cooldown_time
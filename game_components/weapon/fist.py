@@ -4,10 +4,12 @@ from game_components.weapon.base import BaseWeapon
 from game_components.character.user_character import Character
 from game_components.constants import HOOK_VELOCITY, KICK_VELOCITY, FIST_HIT_DAMAGE, PosType, DEFAULT_ROTATION_SPEED
 from game_components.sounds import play_kick_sound
-from game_components.events.hit_effect import HitVisualEffect
+from game_components.particles import emit_hit
 
 
 class Fists(BaseWeapon):
+    __slots__ = ('min_damage', 'max_damage', 'hook_power', 'push_power')
+
     def __init__(self, position: PosType,
                  damage: float = FIST_HIT_DAMAGE,
                  hook_power: float = HOOK_VELOCITY,
@@ -34,7 +36,7 @@ class Fists(BaseWeapon):
             else:
                 direction = 1
                 position = random.choice((target.rect.midleft, target.rect.topleft, target.rect.bottomleft))
-            HitVisualEffect(position, direction=direction)
+            emit_hit(position, direction=direction)
             play_kick_sound()
             self.set_cooldown()
 
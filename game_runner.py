@@ -25,9 +25,14 @@ def get_game_obj() -> 'GameRunner':
 
     environ['VisualPygameOn'] = 'on'
     environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+    if environ.get('HEADLESS', '').lower() not in ('', '0', 'false', 'no', 'off'):
+        # drivers must be chosen before pygame init, config based headless mode is handled in screen.py
+        environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        environ.setdefault('SDL_AUDIODRIVER', 'dummy')
 
     from time import time
-    from typing import Dict, Callable
+    from typing import Dict, Callable, Optional
+    from math import ceil
     from pygame import init, mixer
 
     init()
@@ -47,7 +52,11 @@ def get_game_obj() -> 'GameRunner':
 
     from redeems import RewardRedeemedObj
     from game_components.screen import MAIN_DISPLAY
+    from game_components.render import RENDERER
+    from game_components.quality import QUALITY
     from game_components.game import Game
+    from game_components.AI.perception import PERCEPTION
+    from game_components.global_data import GD
     from game_components.character.user_character import Character
     from game_components.character.visual.base import CharVisualError
     from game_components.constants import JUMP_VELOCITY, AttrsCons
@@ -55,12 +64,12 @@ def get_game_obj() -> 'GameRunner':
     from game_components.AI.go_and_kiss import GoAndKiss
     from game_components.AI.go_and_kick import GoAndKick
     from game_components.errors import RedeemError, ProhibitedColor
-    from game_components.utils import add_outline_to_image, DEFAULT_FONT, normalize_color
+    from game_components.utils import render_text, normalize_color
     from game_components.save_functions import save_character_attr
 
     from logger import LOGGER
 
-    ONLINE_TEXT = add_outline_to_image(DEFAULT_FONT.render(working_msg, 1, [255, 255, 255], [100, 100, 100]))
+    ONLINE_TEXT = render_text(working_msg, color=[255, 255, 255], background=[100, 100, 100])
     ONLINE_TEXT_POS = list(MAIN_DISPLAY.get_rect().topright)
     ONLINE_TEXT_POS[0] -= ONLINE_TEXT.get_width()
 
@@ -70,6 +79,7 @@ def get_game_obj() -> 'GameRunner':
         def __init__(self):
             self.is_running: int = 1
             self.game: Game = Game()
+            self.idle_since: Optional[float] = None
             self.redeem_processors: Dict[str, Callable] = {
                 RedeemsNames.spawn: self.process_spawn_redeem,
                 RedeemsNames.jump: self.process_jump_redeem,
@@ -91,46 +101,74 @@ def get_game_obj() -> 'GameRunner':
             pygame_clock = Clock()
             display.update()
             start = time()
+            accumulator = 0.
+            step = GD.simulation_step
 
             while self.is_running:
                 events = EVENT.get()
-                finish = time()
 
-                pygame_clock.tick(self.FPS)
+                fps = self.get_target_fps(now=start)
+                pygame_clock.tick(fps)
 
-                delta_time = finish - start
-                if delta_time > 0.5:
-                    start = time()
-                    continue
+                finish = time()
+                # long frames are clamped, so simulation slows down instead of making huge steps
+                accumulator += min(finish - start, GD.max_frame_time)
                 start = finish
 
-                MAIN_DISPLAY.fill((0, 255, 0))
                 for event in events:
                     if event.type == pygame.QUIT:
+                        PERCEPTION.shutdown()
                         close_program_pygame()
                         self.is_running = 0
                         break
                 if not self.is_running:
                     break
 
-                self.game.update(dt=delta_time)
+                # at idle rate several steps per frame are expected
+                max_steps = max(GD.max_simulation_steps, ceil(1 / (fps * step)))
+                steps = 0
+                while accumulator >= step and steps < max_steps:
+                    self.game.simulate(dt=step)
+                    accumulator -= step
+                    steps += 1
+                if accumulator >= step:
+                    # could not catch up, dropping the rest
+                    accumulator %= step
+
+                RENDERER.begin_frame()
+                self.game.draw(alpha=accumulator / step)
 
                 self.draw_fps(pygame_clock.get_fps())
                 self.draw_bot_online()
 
-                display.update()
+                RENDERER.end_frame()
+                QUALITY.add_frame_time(time() - finish, budget=1 / self.FPS)
+
+        def get_target_fps(self, now: float) -> int:
+            if not GD.adaptive_fps or not self.game.is_idle:
+                self.idle_since = None
+                return self.FPS
+
+            if self.idle_since is None:
+                self.idle_since = now
+            return GD.idle_fps if now - self.idle_since > GD.idle_delay else self.FPS
+
+        def wake_up(self):
+            self.idle_since = None
 
         @staticmethod
         def draw_bot_online():
-            MAIN_DISPLAY.blit(ONLINE_TEXT, ONLINE_TEXT_POS)
+            RENDERER.blit(ONLINE_TEXT, ONLINE_TEXT_POS)
 
         @staticmethod
         def draw_fps(fps):
-            fps_text = DEFAULT_FONT.render(str(int(fps)), True, [255, 255, 255], [0, 0, 0])
-            MAIN_DISPLAY.blit(fps_text, (0, 0))
+            fps_text = render_text(str(int(fps)), color=[255, 255, 255], background=[0, 0, 0], outline=False)
+            RENDERER.blit(fps_text, (0, 0))
 
         def process_redeem(self, redeem: RewardRedeemedObj):
             LOGGER.info(f'{redeem.user_name} застосував "{redeem.name}" з аргументом {redeem.input}')
+            self.wake_up()
+            self.game.wake_up_character(redeem.user_name)
 
             process_func = self.redeem_processors.get(redeem.name)
             if redeem.name in RedeemsNames.commands_to_ignore:
@@ -144,9 +182,8 @@ def get_game_obj() -> 'GameRunner':
             user_name = redeem.user_name
             if user_name not in self.game.characters:
                 self.game.add_character(user_name)
-                for event in self.game.events:
-                    if event.process_user_spawn:
-                        event.process_new_user(character=self.game.get_character(user_name))
+                for event in tuple(self.game.events.spawn_listeners):
+                    event.process_new_user(character=self.game.get_character(user_name))
 
         def process_eyes_recolor_redeem(self, redeem: RewardRedeemedObj):
             self.process_recolor_redeem(redeem, AttrsCons.eyes_color.value)